@@ -0,0 +1,42 @@
+"""Application entry point: wires storage, parsing, NATS and the API."""
+
+import asyncio
+import logging
+
+import uvicorn
+
+from src.api import app as api_app
+from src.api.order_notifier import OrderNotifier
+from src.api.websocket_manager import WebSocketManager
+from src.config.settings import settings
+from src.storage.config_manager import ConfigManager
+from src.storage.file_storage import FileStorage
+from src.storage.order_manager import OrderManager
+from src.utils.logger import setup_logger
+
+logger = setup_logger()
+
+
+async def build_app():
+    """Construct and initialize the application components."""
+    config_manager = ConfigManager()
+    await config_manager.load_config_async()
+
+    websocket_manager = WebSocketManager()
+    order_notifier = OrderNotifier(websocket_manager, config_manager)
+    file_storage = FileStorage()
+    order_manager = OrderManager(file_storage, order_notifier, config_manager)
+    await order_manager.initialize()
+
+    api_app.config_manager = config_manager
+    api_app.order_manager = order_manager
+    return api_app.app
+
+
+def main() -> None:
+    application = asyncio.run(build_app())
+    uvicorn.run(application, host=settings.API_HOST, port=settings.API_PORT)
+
+
+if __name__ == "__main__":
+    main()
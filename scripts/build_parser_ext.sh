@@ -0,0 +1,10 @@
+#!/usr/bin/env sh
+# Compile the CPU-hot parser modules to C extensions with mypyc.
+#
+# The parser is the hot path of log ingestion and both modules are fully
+# type-annotated, so mypyc gives a solid speedup without source changes.
+# The resulting .so files shadow the pure-Python modules; delete them to
+# go back to the interpreted versions.
+set -e
+cd "$(dirname "$0")/.."
+python -m mypyc src/parser/log_parser.py src/parser/order_extractor.py
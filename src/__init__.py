@@ -0,0 +1 @@
+"""HyperNodeServer — parses HyperLiquid node logs and serves order data."""
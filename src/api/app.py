@@ -0,0 +1,60 @@
+"""FastAPI application exposing orders, config and node health."""
+
+import logging
+
+from fastapi import FastAPI, HTTPException
+
+from src.monitoring.node_health import NodeHealthMonitor
+from src.storage.config_manager import ConfigManager, NodeHealthConfig
+
+logger = logging.getLogger(__name__)
+
+app = FastAPI(title="HyperNodeServer")
+
+# Wired at startup by main.py; tests patch these module attributes.
+config_manager = ConfigManager()
+order_manager = None
+
+
+@app.get("/api/v1/config/node-health")
+async def get_node_health_config() -> dict:
+    """Return the node health monitoring configuration."""
+    try:
+        config = config_manager.get_config()
+    except RuntimeError:
+        raise HTTPException(status_code=503, detail="Config is not loaded")
+    return config.node_health.model_dump()
+
+
+@app.put("/api/v1/config/node-health")
+async def update_node_health_config(node_health: NodeHealthConfig) -> dict:
+    """Replace the node health monitoring configuration."""
+    try:
+        config = await config_manager.update_config_async(
+            {"node_health": node_health.model_dump()}
+        )
+    except RuntimeError:
+        raise HTTPException(status_code=503, detail="Config is not loaded")
+    return config.node_health.model_dump()
+
+
+@app.get("/api/v1/node/health")
+async def get_node_health() -> dict:
+    """Return the current node health verdict."""
+    try:
+        config = config_manager.get_config()
+    except RuntimeError:
+        raise HTTPException(status_code=503, detail="Config is not loaded")
+    monitor = NodeHealthMonitor(
+        config.node_logs_path,
+        threshold_minutes=config.node_health.threshold_minutes,
+    )
+    return monitor.get_health_status()
+
+
+@app.get("/api/v1/orders")
+async def get_orders() -> list:
+    """Return the current set of orders."""
+    if order_manager is None:
+        raise HTTPException(status_code=503, detail="Order manager is not ready")
+    return [order.to_dict() for order in order_manager.get_orders()]
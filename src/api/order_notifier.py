@@ -0,0 +1,29 @@
+"""Pushes order updates out to websocket subscribers."""
+
+import logging
+from typing import List
+
+from src.api.websocket_manager import WebSocketManager
+from src.models.order import Order
+
+logger = logging.getLogger(__name__)
+
+
+class OrderNotifier:
+    """Formats order events and hands them to the websocket manager."""
+
+    def __init__(self, websocket_manager: WebSocketManager, config_manager=None) -> None:
+        self.websocket_manager = websocket_manager
+        self.config_manager = config_manager
+
+    async def notify_order_update(self, order: Order) -> None:
+        """Broadcast a single order update."""
+        await self.websocket_manager.broadcast(
+            {"type": "order_update", "order": order.to_dict()}
+        )
+
+    async def notify_orders_batch(self, orders: List[Order]) -> None:
+        """Broadcast a batch of order updates as one message."""
+        await self.websocket_manager.broadcast(
+            {"type": "orders_batch", "orders": [order.to_dict() for order in orders]}
+        )
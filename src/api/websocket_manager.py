@@ -0,0 +1,32 @@
+"""Tracking and broadcasting over active websocket connections."""
+
+import logging
+from typing import List
+
+logger = logging.getLogger(__name__)
+
+
+class WebSocketManager:
+    """Keeps the list of connected websocket clients."""
+
+    def __init__(self) -> None:
+        self.active_connections: List = []
+
+    async def connect(self, websocket) -> None:
+        await websocket.accept()
+        self.active_connections.append(websocket)
+
+    def disconnect(self, websocket) -> None:
+        if websocket in self.active_connections:
+            self.active_connections.remove(websocket)
+
+    async def broadcast(self, message: dict) -> None:
+        """Send a message to every connected client, dropping dead ones."""
+        dead = []
+        for connection in self.active_connections:
+            try:
+                await connection.send_json(message)
+            except Exception:
+                dead.append(connection)
+        for connection in dead:
+            self.disconnect(connection)
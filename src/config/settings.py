@@ -0,0 +1,26 @@
+"""Process-level settings, overridable through environment variables."""
+
+import os
+
+
+class Settings:
+    """Environment-backed settings used to bootstrap the runtime config."""
+
+    def __init__(self) -> None:
+        self.NODE_LOGS_PATH = os.getenv("NODE_LOGS_PATH", "/var/hl/node_logs")
+        self.DATA_PATH = os.getenv("DATA_PATH", "data")
+        self.LOGS_PATH = os.getenv("LOGS_PATH", "logs")
+        self.API_HOST = os.getenv("API_HOST", "0.0.0.0")
+        self.API_PORT = int(os.getenv("API_PORT", "8000"))
+        self.LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+        self.LOG_MAX_SIZE_MB = int(os.getenv("LOG_MAX_SIZE_MB", "50"))
+        self.LOG_RETENTION_DAYS = int(os.getenv("LOG_RETENTION_DAYS", "30"))
+        self.WS_MAX_CONNECTIONS = int(os.getenv("WS_MAX_CONNECTIONS", "100"))
+        self.NATS_URL = os.getenv("NATS_URL", "nats://localhost:4222")
+        self.NATS_CREDS_FILE = os.getenv("NATS_CREDS_FILE", "")
+        self.NATS_SUBJECT_PREFIX = os.getenv("NATS_SUBJECT_PREFIX", "orders")
+        self.MIN_LIQUIDITY = float(os.getenv("MIN_LIQUIDITY", "0"))
+        self.CONFIG_REFRESH_INTERVAL = int(os.getenv("CONFIG_REFRESH_INTERVAL", "60"))
+
+
+settings = Settings()
@@ -0,0 +1,3 @@
+from src.models.order import Order
+
+__all__ = ["Order"]
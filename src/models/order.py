@@ -0,0 +1,45 @@
+"""Order model shared by the parser, storage and publishing layers."""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass
+class Order:
+    """A single order extracted from the node logs."""
+
+    id: str
+    symbol: str
+    side: str
+    price: float
+    size: float
+    owner: str
+    timestamp: datetime
+    status: str
+
+    def to_dict(self) -> dict:
+        """Serialize the order to a JSON-compatible dict."""
+        return {
+            "id": self.id,
+            "symbol": self.symbol,
+            "side": self.side,
+            "price": self.price,
+            "size": self.size,
+            "owner": self.owner,
+            "timestamp": self.timestamp.isoformat(),
+            "status": self.status,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Order":
+        """Restore an order from its dict representation."""
+        return cls(
+            id=data["id"],
+            symbol=data["symbol"],
+            side=data["side"],
+            price=data["price"],
+            size=data["size"],
+            owner=data["owner"],
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            status=data["status"],
+        )
@@ -0,0 +1,3 @@
+from src.monitoring.node_health import NodeHealthMonitor
+
+__all__ = ["NodeHealthMonitor"]
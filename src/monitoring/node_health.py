@@ -0,0 +1,53 @@
+"""Freshness monitoring for the node's log directory."""
+
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class NodeHealthMonitor:
+    """Reports whether the node is still writing logs.
+
+    The node is considered healthy while the newest file under
+    ``logs_path`` was modified within ``threshold_minutes``.
+    """
+
+    def __init__(self, logs_path: str, threshold_minutes: int = 5) -> None:
+        self.logs_path = Path(logs_path)
+        self.threshold_minutes = threshold_minutes
+
+    def get_last_log_update_time(self) -> Optional[datetime]:
+        """Return the mtime of the newest log file, or None if there are none."""
+        if not self.logs_path.exists():
+            return None
+        latest: Optional[float] = None
+        for path in self.logs_path.rglob("*"):
+            if not path.is_file():
+                continue
+            mtime = path.stat().st_mtime
+            if latest is None or mtime > latest:
+                latest = mtime
+        if latest is None:
+            return None
+        return datetime.fromtimestamp(latest, tz=timezone.utc)
+
+    def get_health_status(self) -> dict:
+        """Return the current health verdict and its inputs."""
+        last_update = self.get_last_log_update_time()
+        if last_update is None:
+            return {
+                "healthy": False,
+                "last_update": None,
+                "age_minutes": None,
+                "threshold_minutes": self.threshold_minutes,
+            }
+        age_minutes = (datetime.now(timezone.utc) - last_update).total_seconds() / 60
+        return {
+            "healthy": age_minutes <= self.threshold_minutes,
+            "last_update": last_update.isoformat(),
+            "age_minutes": age_minutes,
+            "threshold_minutes": self.threshold_minutes,
+        }
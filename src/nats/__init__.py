@@ -0,0 +1,5 @@
+from src.nats.auth import JWTAuth
+from src.nats.monitoring import NATSMonitoring
+from src.nats.nats_client import NATSClient
+
+__all__ = ["JWTAuth", "NATSMonitoring", "NATSClient"]
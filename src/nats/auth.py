@@ -0,0 +1,56 @@
+"""Загрузка JWT-учётных данных для подключения к NATS."""
+
+import logging
+from typing import Optional
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+class JWTAuth:
+    """Держатель JWT/seed учётных данных из файла credentials."""
+
+    def __init__(self) -> None:
+        self.jwt: Optional[str] = None
+        self.seed: Optional[str] = None
+        self.user: Optional[str] = None
+        self._authenticated = False
+
+    def load_credentials(self, file_path: str) -> None:
+        """Загрузить учётные данные из JSON-файла.
+
+        Raises:
+            FileNotFoundError: файл не найден.
+            ValueError: некорректный JSON или отсутствуют обязательные поля.
+        """
+        try:
+            with open(file_path, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Файл учётных данных не найден: {file_path}")
+        try:
+            credentials = orjson.loads(raw)
+        except orjson.JSONDecodeError as exc:
+            raise ValueError(f"Некорректный JSON в файле учётных данных: {exc}")
+
+        if "jwt" not in credentials:
+            raise ValueError("Отсутствует поле 'jwt' в учётных данных")
+        if "seed" not in credentials:
+            raise ValueError("Отсутствует поле 'seed' в учётных данных")
+
+        self.jwt = credentials["jwt"]
+        self.seed = credentials["seed"]
+        self.user = credentials.get("user")
+        logger.info("Учётные данные NATS загружены для пользователя %s", self.user)
+
+    def is_loaded(self) -> bool:
+        """Загружены ли учётные данные."""
+        return self.jwt is not None and self.seed is not None
+
+    def is_authenticated(self) -> bool:
+        """Прошла ли аутентификация на сервере."""
+        return self._authenticated
+
+    def mark_authenticated(self) -> None:
+        self._authenticated = True
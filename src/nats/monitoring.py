@@ -0,0 +1,126 @@
+"""Счётчики и состояние здоровья NATS-клиента."""
+
+import logging
+import time
+from datetime import datetime
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Сколько секунд без активности считается деградацией.
+DEGRADED_AFTER_SECONDS = 300
+
+
+class NATSMonitoring:
+    """Собирает метрики публикаций, ошибок и состояния соединения."""
+
+    def __init__(self, time_source: Callable[[], float] = time.monotonic) -> None:
+        # Плоские int-счётчики: один LOAD/STORE на инкремент вместо двух
+        # обращений к вложенному словарю в горячем пути публикации.
+        self._total_sent = 0
+        self._total_processed = 0
+        self._total_errors = 0
+        self._established_count = 0
+        self._lost_count = 0
+        # Интервалы считаются по подменяемым монотонным часам, чтобы тесты
+        # могли продвигать время без реального ожидания.
+        self._time = time_source
+        self._started_at: Optional[float] = None
+        self._connected_at: Optional[float] = None
+        self._last_activity_time: Optional[float] = None
+        self._last_error_time: Optional[float] = None
+        self._last_error: Optional[str] = None
+        # Снимок метрик пересобирается только после изменения счётчиков.
+        self._metrics_cache: Optional[dict] = None
+        self._dirty = True
+
+    def on_message_sent(self) -> None:
+        self._total_sent += 1
+        self._total_processed += 1
+        self._last_activity_time = self._time()
+        self._dirty = True
+
+    def on_messages_sent(self, count: int) -> None:
+        """Учесть пакет сообщений одним обновлением счётчиков."""
+        self._total_sent += count
+        self._total_processed += count
+        self._last_activity_time = self._time()
+        self._dirty = True
+
+    def on_error(self, error: str) -> None:
+        self._total_errors += 1
+        self._last_error = error
+        self._last_error_time = self._time()
+        self._dirty = True
+
+    def on_connection_established(self) -> None:
+        self._established_count += 1
+        now = self._time()
+        self._connected_at = now
+        self._last_activity_time = now
+        if self._started_at is None:
+            self._started_at = now
+        self._dirty = True
+
+    def on_connection_lost(self) -> None:
+        self._lost_count += 1
+        self._connected_at = None
+        self._dirty = True
+
+    def get_metrics(self) -> dict:
+        """Построить снимок метрик для API/логов.
+
+        Снимок кешируется по dirty-биту: производные от времени поля
+        (uptime, скорость) пересчитываются при первом запросе после
+        очередного события, а не на каждый опрос.
+        """
+        if not self._dirty and self._metrics_cache is not None:
+            # Наружу всегда уходит копия: кеш общий для всех опросов,
+            # и мутация снимка у вызывающего не должна его портить.
+            return {section: dict(values) for section, values in self._metrics_cache.items()}
+        uptime = 0.0
+        if self._connected_at is not None:
+            uptime = self._time() - self._connected_at
+        messages_per_second = 0.0
+        if self._started_at is not None:
+            elapsed = self._time() - self._started_at
+            if elapsed > 0:
+                messages_per_second = self._total_sent / elapsed
+        self._metrics_cache = {
+            "messages": {
+                "total_sent": self._total_sent,
+                "total_processed": self._total_processed,
+                "total_errors": self._total_errors,
+                "messages_per_second": messages_per_second,
+            },
+            "connection": {
+                "established_count": self._established_count,
+                "lost_count": self._lost_count,
+                "connected": self._connected_at is not None,
+                "uptime_seconds": uptime,
+            },
+            "errors": {
+                "last_error": self._last_error,
+                # ISO-строка собирается только здесь: в on_error хранится
+                # монотонный float, перевод в стенное время — при выдаче.
+                "last_error_time": (
+                    datetime.fromtimestamp(
+                        time.time() - (self._time() - self._last_error_time)
+                    ).isoformat()
+                    if self._last_error_time is not None
+                    else None
+                ),
+            },
+        }
+        self._dirty = False
+        return {section: dict(values) for section, values in self._metrics_cache.items()}
+
+    def get_health_status(self) -> dict:
+        """Оценить состояние клиента по свежести активности."""
+        if self._connected_at is None:
+            return {"status": "disconnected"}
+        if self._last_activity_time is not None:
+            idle = self._time() - self._last_activity_time
+            if idle > DEGRADED_AFTER_SECONDS:
+                return {"status": "degraded", "idle_seconds": idle}
+        return {"status": "healthy"}
@@ -0,0 +1,323 @@
+"""Асинхронный NATS-клиент: публикация ордеров и подписка на конфигурацию."""
+
+import asyncio
+import logging
+import random
+from typing import Callable, Optional
+
+import nats
+import orjson
+
+from src.nats.auth import JWTAuth
+from src.nats.monitoring import NATSMonitoring
+
+logger = logging.getLogger(__name__)
+
+CONFIG_SUBJECT = "hypernode.config"
+
+# Очередь отправки: ограниченный размер создаёт обратное давление на
+# производителей, фиксированное число воркеров конвейеризует публикации.
+SEND_QUEUE_MAXSIZE = 1024
+SENDER_WORKER_COUNT = 4
+# Сколько сообщений воркер снимает с очереди за один проход до flush.
+SEND_FLUSH_MAX = 5000
+
+# frozenset: проверка наличия полей — одна C-операция разности множеств,
+# членство side/status — хеш-поиск вместо прохода по списку.
+REQUIRED_FIELDS = frozenset(
+    {"id", "symbol", "side", "price", "size", "owner", "timestamp", "status"}
+)
+VALID_SIDES = frozenset({"Bid", "Ask", "bid", "ask"})
+VALID_STATUSES = frozenset({"open", "filled", "canceled", "triggered"})
+
+# Нормализация side одной выборкой из таблицы вместо .lower() и сравнения.
+SIDE_NORMALIZED = {"Bid": "Bid", "bid": "Bid", "Ask": "Ask", "ask": "Ask"}
+
+# orjson сериализует datetime сам: наивные метки трактуются как UTC и
+# выводятся с суффиксом "Z" — Python-код времени вообще не форматирует.
+_ORJSON_OPTS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+class NATSClient:
+    """Публикует данные ордеров в NATS с повторными попытками."""
+
+    def __init__(
+        self,
+        url: str = "nats://localhost:4222",
+        max_retry_attempts: int = 3,
+        retry_delay: float = 1.0,
+        max_retry_delay: float = 30.0,
+    ) -> None:
+        self.url = url
+        self.max_retry_attempts = max_retry_attempts
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.auth = JWTAuth()
+        self._nc = None
+        self._is_connected = False
+        self._retry_count = 0
+        self._config_subscription = None
+        self._config_callback: Optional[Callable] = None
+        self._monitoring = NATSMonitoring()
+        self._send_queue: Optional[asyncio.Queue] = None
+        self._sender_tasks: list = []
+        # Кеш subject'ов по символу: поток ордеров почти всегда крутится
+        # вокруг нескольких символов, незачем собирать строку на каждый.
+        self._subject_cache: dict = {}
+
+    @property
+    def is_connected(self) -> bool:
+        return self._is_connected
+
+    @property
+    def is_subscribed_to_config(self) -> bool:
+        return self._config_subscription is not None
+
+    async def connect(self, creds_file: Optional[str] = None) -> None:
+        """Подключиться к NATS, при необходимости — с JWT-учётными данными."""
+        try:
+            options = {"servers": [self.url]}
+            if creds_file:
+                self.auth.load_credentials(creds_file)
+                options["user_jwt_cb"] = lambda: self.auth.jwt
+                options["signature_cb"] = lambda nonce: self.auth.seed
+            self._nc = await nats.connect(**options)
+            self._is_connected = True
+            self._retry_count = 0
+            self._monitoring.on_connection_established()
+            logger.info("Подключение к NATS установлено: %s", self.url)
+        except Exception as exc:
+            self._monitoring.on_error(str(exc))
+            raise ConnectionError(f"Не удалось подключиться к NATS: {exc}")
+
+    async def disconnect(self) -> None:
+        """Отключиться от NATS, сняв подписки."""
+        if self._config_subscription is not None:
+            await self._config_subscription.unsubscribe()
+            self._config_subscription = None
+        await self._stop_sender_workers()
+        if self._nc is not None:
+            await self._nc.close()
+            self._nc = None
+        self._is_connected = False
+        self._monitoring.on_connection_lost()
+        logger.info("Соединение с NATS закрыто")
+
+    async def __aenter__(self) -> "NATSClient":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.disconnect()
+
+    async def publish_order_data(self, order_data: dict, topic: Optional[str] = None) -> None:
+        """Опубликовать данные ордера в NATS."""
+        self._validate_order_data(order_data)
+        formatted = self._format_order_data(order_data)
+        # orjson encodes at C level straight to bytes — no Python-side
+        # encoder state machine and no separate .encode() pass.
+        payload = orjson.dumps(formatted, option=_ORJSON_OPTS)
+        subject = topic if topic is not None else self._order_subject(order_data["symbol"])
+        await self._publish_with_retry(subject, payload)
+        # Инкременты мониторинга инлайнятся: на каждое сообщение это
+        # экономит кадр вызова on_message_sent.
+        m = self._monitoring
+        m._total_sent += 1
+        m._total_processed += 1
+        m._last_activity_time = m._time()
+        m._dirty = True
+
+    async def publish_order_batch(
+        self, orders: list, topic: Optional[str] = None
+    ) -> None:
+        """Опубликовать пакет ордеров с одним flush в конце.
+
+        Полезные нагрузки сериализуются заранее, публикации уходят в буфер
+        соединения без промежуточных flush, и только хвост пакета ждёт
+        подтверждения сокета.
+        """
+        payloads = []
+        for order_data in orders:
+            self._validate_order_data(order_data)
+            formatted = self._format_order_data(order_data)
+            subject = topic if topic is not None else self._order_subject(order_data["symbol"])
+            payloads.append((subject, orjson.dumps(formatted, option=_ORJSON_OPTS)))
+        try:
+            for subject, payload in payloads:
+                await self._nc.publish(subject, payload)
+            await self._nc.flush()
+        except Exception as exc:
+            self._monitoring.on_error(str(exc))
+            raise ConnectionError(f"Не удалось опубликовать сообщение в NATS: {exc}")
+        self._monitoring.on_messages_sent(len(payloads))
+
+    async def enqueue_order_data(self, order_data: dict, topic: Optional[str] = None) -> None:
+        """Поставить ордер в очередь отправки.
+
+        Заполненная очередь блокирует производителя (обратное давление),
+        публикацией занимаются фоновые воркеры. Ошибки публикации
+        учитываются в мониторинге, но производителю не возвращаются.
+        """
+        if self._send_queue is None:
+            self._start_sender_workers()
+        self._validate_order_data(order_data)
+        formatted = self._format_order_data(order_data)
+        subject = topic if topic is not None else self._order_subject(order_data["symbol"])
+        await self._send_queue.put((subject, orjson.dumps(formatted, option=_ORJSON_OPTS)))
+
+    async def drain_send_queue(self) -> None:
+        """Дождаться публикации всего, что стоит в очереди отправки."""
+        if self._send_queue is not None:
+            await self._send_queue.join()
+
+    def _start_sender_workers(self) -> None:
+        """Создать очередь отправки и запустить воркеров-отправителей."""
+        self._send_queue = asyncio.Queue(maxsize=SEND_QUEUE_MAXSIZE)
+        self._sender_tasks = [
+            asyncio.create_task(self._sender_worker())
+            for _ in range(SENDER_WORKER_COUNT)
+        ]
+
+    async def _stop_sender_workers(self) -> None:
+        """Остановить воркеров, дождавшись остатка очереди."""
+        if self._send_queue is None:
+            return
+        await self._send_queue.join()
+        for task in self._sender_tasks:
+            task.cancel()
+        await asyncio.gather(*self._sender_tasks, return_exceptions=True)
+        self._sender_tasks = []
+        self._send_queue = None
+
+    async def _sender_worker(self) -> None:
+        """Публиковать сообщения из очереди отправки пачками.
+
+        Всё, что скопилось в очереди (до SEND_FLUSH_MAX), уходит в буфер
+        соединения подряд и подтверждается одним flush — стоимость сокета
+        размазывается по всей пачке.
+        """
+        m = self._monitoring
+        queue = self._send_queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < SEND_FLUSH_MAX:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                for subject, payload in batch:
+                    await self._nc.publish(subject, payload)
+                await self._nc.flush()
+                m._total_sent += len(batch)
+                m._total_processed += len(batch)
+                m._last_activity_time = m._time()
+                m._dirty = True
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self._monitoring.on_error(str(exc))
+                logger.error("Ошибка публикации из очереди отправки: %s", exc)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _publish_with_retry(self, subject: str, payload: bytes) -> None:
+        """Публикация с экспоненциальными повторными попытками."""
+        last_error: Optional[Exception] = None
+        for attempt in range(self.max_retry_attempts):
+            try:
+                await self._nc.publish(subject, payload)
+                return
+            except Exception as exc:
+                last_error = exc
+                logger.warning(
+                    "Ошибка публикации (попытка %d/%d): %s",
+                    attempt + 1,
+                    self.max_retry_attempts,
+                    exc,
+                )
+                if attempt < self.max_retry_attempts - 1:
+                    await asyncio.sleep(self.retry_delay * (2 ** attempt))
+        self._monitoring.on_error(str(last_error))
+        raise ConnectionError(f"Не удалось опубликовать сообщение в NATS: {last_error}")
+
+    async def _reconnect_with_retry(self) -> None:
+        """Восстановить соединение после обрыва.
+
+        Экспоненциальная задержка с полным джиттером: рост 2**attempt с
+        потолком max_retry_delay разводит клиентов по времени и не даёт
+        им одновременно штурмовать только что поднявшийся сервер.
+        """
+        for attempt in range(self.max_retry_attempts):
+            try:
+                await self.connect()
+                return
+            except ConnectionError as exc:
+                logger.warning(
+                    "Ошибка переподключения (попытка %d/%d): %s",
+                    attempt + 1,
+                    self.max_retry_attempts,
+                    exc,
+                )
+                if attempt < self.max_retry_attempts - 1:
+                    delay = min(self.retry_delay * (2 ** attempt), self.max_retry_delay)
+                    await asyncio.sleep(random.uniform(0, delay))
+        raise ConnectionError("Не удалось переподключиться к NATS")
+
+    def _order_subject(self, symbol: str) -> str:
+        """Вернуть subject для символа, собирая строку только один раз."""
+        subject = self._subject_cache.get(symbol)
+        if subject is None:
+            subject = self._subject_cache[symbol] = f"orders.{symbol}"
+        return subject
+
+    def _validate_order_data(self, order_data: dict) -> None:
+        """Проверить обязательные поля и значения данных ордера."""
+        missing = REQUIRED_FIELDS - order_data.keys()
+        if missing:
+            raise ValueError(f"Отсутствует обязательное поле: {next(iter(missing))}")
+        if order_data["side"] not in VALID_SIDES:
+            raise ValueError("Поле 'side' должно быть Bid или Ask")
+        if not isinstance(order_data["price"], (int, float)) or order_data["price"] <= 0:
+            raise ValueError("Поле 'price' должно быть положительным числом")
+        if not isinstance(order_data["size"], (int, float)) or order_data["size"] <= 0:
+            raise ValueError("Поле 'size' должно быть положительным числом")
+        if order_data["status"] not in VALID_STATUSES:
+            raise ValueError(f"Недопустимый статус: {order_data['status']}")
+
+    def _format_order_data(self, order_data: dict) -> dict:
+        """Нормализовать данные ордера перед сериализацией."""
+        formatted = dict(order_data)
+        # side уже проверен в _validate_order_data, таблица не промахнётся.
+        formatted["side"] = SIDE_NORMALIZED[formatted["side"]]
+        return formatted
+
+    async def subscribe_to_config(self, callback: Callable) -> None:
+        """Подписаться на обновления конфигурации."""
+        self._config_callback = callback
+        self._config_subscription = await self._nc.subscribe(
+            CONFIG_SUBJECT, cb=self._handle_config_message
+        )
+        logger.info("Подписка на конфигурацию оформлена: %s", CONFIG_SUBJECT)
+
+    async def _handle_config_message(self, msg) -> None:
+        """Обработать входящее сообщение с конфигурацией."""
+        try:
+            config = orjson.loads(msg.data)
+        except ValueError as exc:
+            logger.error("Некорректный JSON в сообщении конфигурации: %s", exc)
+            return
+        if "symbols" not in config:
+            logger.error("Сообщение конфигурации без поля 'symbols': %s", config)
+            return
+        if self._config_callback is None:
+            logger.warning("Получена конфигурация, но обработчик не задан")
+            return
+        await self._config_callback(config)
+
+    def get_metrics(self) -> dict:
+        return self._monitoring.get_metrics()
+
+    def get_health_status(self) -> dict:
+        return self._monitoring.get_health_status()
@@ -0,0 +1,4 @@
+from src.parser.log_parser import LogParser
+from src.parser.order_extractor import OrderExtractor
+
+__all__ = ["LogParser", "OrderExtractor"]
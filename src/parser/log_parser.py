@@ -0,0 +1,57 @@
+"""Line-oriented NDJSON parser for the node's order status logs."""
+
+import logging
+import mmap
+from typing import List
+
+import orjson
+
+from src.models.order import Order
+from src.parser.order_extractor import OrderExtractor
+
+logger = logging.getLogger(__name__)
+
+
+class LogParser:
+    """Parses node log files and yields the orders found in them."""
+
+    def __init__(self) -> None:
+        self.order_extractor = OrderExtractor()
+
+    def parse_file(self, file_path: str) -> List[Order]:
+        """Parse a single NDJSON log file into a list of orders.
+
+        Lines that are not valid JSON or do not describe a valid order
+        are skipped.
+        """
+        orders: List[Order] = []
+        with open(file_path, "rb") as f:
+            try:
+                # Memory-map instead of read(): the kernel pages the file in
+                # on demand and no whole-file bytes object (plus the line
+                # list from splitlines) is materialized up front.
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty file cannot be mapped
+                return orders
+            with mm:
+                size = len(mm)
+                start = 0
+                while start < size:
+                    end = mm.find(b"\n", start)
+                    if end == -1:
+                        end = size
+                    line = mm[start:end].strip()
+                    start = end + 1
+                    # Cheap first/last byte check: plain-text noise lines are
+                    # rejected without paying for the json exception path.
+                    if not (line[:1] == b"{" and line[-1:] == b"}"):
+                        continue
+                    try:
+                        log_entry = orjson.loads(line)
+                    except ValueError:
+                        logger.debug("Skipping non-JSON log line: %.60s", line)
+                        continue
+                    order = self.order_extractor.extract_order(log_entry)
+                    if order is not None:
+                        orders.append(order)
+        return orders
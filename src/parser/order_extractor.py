@@ -0,0 +1,94 @@
+"""Extraction of :class:`Order` objects from raw node log entries."""
+
+import functools
+import logging
+from datetime import datetime
+from typing import Optional
+
+from src.models.order import Order
+
+logger = logging.getLogger(__name__)
+
+# Order statuses emitted by the node that never become live orders.
+REJECTED_STATUSES = [
+    "rejected",
+    "marginCanceled",
+    "vaultWithdrawalCanceled",
+    "openInterestCapCanceled",
+    "selfTradeCanceled",
+    "reduceOnlyCanceled",
+    "siblingFilledCanceled",
+    "delistedCanceled",
+    "liquidatedCanceled",
+    "scheduledCancel",
+    "tickRejected",
+    "minTradeNtlRejected",
+]
+
+SIDE_MAP = {"B": "Bid", "A": "Ask"}
+
+
+def _sign(value: float) -> int:
+    return 1 if value > 0 else (-1 if value < 0 else 0)
+
+
+@functools.lru_cache(maxsize=256)
+def _validate_shape(side: object, px_sign: int, sz_sign: int) -> bool:
+    """Cheap shape check for a candidate order.
+
+    Real log streams repeat the same malformed shapes over and over, so
+    the verdict for a (side, price sign, size sign) triple is memoized:
+    a repeated bogus shape short-circuits to a dict lookup.
+    """
+    return side in SIDE_MAP and px_sign > 0 and sz_sign > 0
+
+
+class OrderExtractor:
+    """Converts a decoded node log entry into an :class:`Order`."""
+
+    def extract_order(self, log_entry: dict) -> Optional[Order]:
+        """Extract an order from a log entry, or None if it is not a valid order."""
+        try:
+            status = log_entry.get("status")
+            if status in REJECTED_STATUSES:
+                return None
+
+            raw_order = log_entry.get("order")
+            if not isinstance(raw_order, dict):
+                return None
+
+            side = raw_order.get("side")
+            price = float(raw_order.get("limitPx", 0))
+            size = float(raw_order.get("origSz", 0))
+            if not _validate_shape(side, _sign(price), _sign(size)):
+                return None
+
+            timestamp = self._parse_time(log_entry.get("time"))
+            if timestamp is None:
+                return None
+
+            return Order(
+                id=str(raw_order["oid"]),
+                symbol=raw_order["coin"],
+                side=SIDE_MAP[side],
+                price=price,
+                size=size,
+                owner=log_entry.get("user", ""),
+                timestamp=timestamp,
+                status=status or "open",
+            )
+        except (KeyError, TypeError, ValueError) as exc:
+            logger.debug("Failed to extract order from log entry: %s", exc)
+            return None
+
+    def _parse_time(self, raw_time: object) -> Optional[datetime]:
+        """Parse the node's timestamp, trimming nanoseconds to microseconds."""
+        if not isinstance(raw_time, str):
+            return None
+        try:
+            if "." in raw_time:
+                head, frac = raw_time.split(".", 1)
+                raw_time = f"{head}.{frac[:6]}"
+            return datetime.fromisoformat(raw_time)
+        except ValueError:
+            return None
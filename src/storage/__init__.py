@@ -0,0 +1,12 @@
+from src.storage.config_manager import Config, ConfigManager, NodeHealthConfig, SymbolConfig
+from src.storage.file_storage import FileStorage
+from src.storage.order_manager import OrderManager
+
+__all__ = [
+    "Config",
+    "ConfigManager",
+    "NodeHealthConfig",
+    "SymbolConfig",
+    "FileStorage",
+    "OrderManager",
+]
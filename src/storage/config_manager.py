@@ -0,0 +1,104 @@
+"""Runtime configuration: pydantic models plus a file-backed manager."""
+
+import json
+import logging
+from pathlib import Path
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class SymbolConfig(BaseModel):
+    """Per-symbol filtering rules."""
+
+    symbol: str
+    min_liquidity: float = 0.0
+    enabled: bool = True
+
+
+class NodeHealthConfig(BaseModel):
+    """Settings for the node log freshness monitor."""
+
+    enabled: bool = True
+    threshold_minutes: int = Field(default=5, ge=1)
+    check_interval_seconds: int = Field(default=60, ge=1)
+
+
+class Config(BaseModel):
+    """Full runtime configuration, persisted to ``config.json``."""
+
+    api_host: str = "0.0.0.0"
+    api_port: int = 8000
+    node_logs_path: str = ""
+    data_path: str = "data"
+    logs_path: str = "logs"
+    log_level: str = "INFO"
+    log_max_size_mb: int = 50
+    log_retention_days: int = 30
+    ws_max_connections: int = 100
+    nats_url: str = "nats://localhost:4222"
+    nats_creds_file: str = ""
+    config_refresh_interval: int = 60
+    min_liquidity: float = 0.0
+    symbols_config: List[SymbolConfig] = Field(default_factory=list)
+    node_health: NodeHealthConfig = Field(default_factory=NodeHealthConfig)
+
+
+class ConfigManager:
+    """Loads, updates and persists the runtime :class:`Config`."""
+
+    def __init__(self) -> None:
+        self._config: Optional[Config] = None
+
+    @property
+    def config_file(self) -> Path:
+        return Path(settings.DATA_PATH) / "config.json"
+
+    def get_config(self) -> Config:
+        if self._config is None:
+            raise RuntimeError("Config is not loaded")
+        return self._config
+
+    async def load_config_async(self) -> Config:
+        """Load config from disk, falling back to settings-derived defaults."""
+        if self.config_file.exists():
+            try:
+                data = json.loads(self.config_file.read_text(encoding="utf-8"))
+                self._config = Config(**data)
+                return self._config
+            except (ValueError, TypeError) as exc:
+                logger.warning("Invalid config file, rebuilding defaults: %s", exc)
+        self._config = Config(
+            api_host=settings.API_HOST,
+            api_port=settings.API_PORT,
+            node_logs_path=settings.NODE_LOGS_PATH,
+            data_path=settings.DATA_PATH,
+            logs_path=settings.LOGS_PATH,
+            log_level=settings.LOG_LEVEL,
+            log_max_size_mb=settings.LOG_MAX_SIZE_MB,
+            log_retention_days=settings.LOG_RETENTION_DAYS,
+            ws_max_connections=settings.WS_MAX_CONNECTIONS,
+            nats_url=settings.NATS_URL,
+            nats_creds_file=settings.NATS_CREDS_FILE,
+            config_refresh_interval=settings.CONFIG_REFRESH_INTERVAL,
+            min_liquidity=settings.MIN_LIQUIDITY,
+        )
+        await self._save()
+        return self._config
+
+    async def update_config_async(self, updates: dict) -> Config:
+        """Apply a partial update on top of the loaded config and persist it."""
+        current = self.get_config()
+        merged = current.model_dump()
+        merged.update(updates)
+        self._config = Config(**merged)
+        await self._save()
+        return self._config
+
+    async def _save(self) -> None:
+        Path(settings.DATA_PATH).mkdir(parents=True, exist_ok=True)
+        self.config_file.write_text(self.get_config().model_dump_json(), encoding="utf-8")
@@ -0,0 +1,42 @@
+"""JSON-file persistence for the in-memory order book."""
+
+import json
+import logging
+from pathlib import Path
+from typing import Dict
+
+from src.config.settings import settings
+from src.models.order import Order
+
+logger = logging.getLogger(__name__)
+
+
+class FileStorage:
+    """Stores orders as a single JSON document under ``data_dir``."""
+
+    def __init__(self) -> None:
+        self.data_dir = Path(settings.DATA_PATH)
+
+    @property
+    def orders_file(self) -> Path:
+        return Path(self.data_dir) / "orders.json"
+
+    async def initialize(self) -> None:
+        """Create the data directory if it does not exist."""
+        Path(self.data_dir).mkdir(parents=True, exist_ok=True)
+
+    async def save_orders(self, orders: Dict[str, Order]) -> None:
+        """Persist the full order map to disk."""
+        payload = {order_id: order.to_dict() for order_id, order in orders.items()}
+        self.orders_file.write_text(json.dumps(payload), encoding="utf-8")
+
+    async def load_orders(self) -> Dict[str, Order]:
+        """Load previously persisted orders, if any."""
+        if not self.orders_file.exists():
+            return {}
+        try:
+            payload = json.loads(self.orders_file.read_text(encoding="utf-8"))
+            return {order_id: Order.from_dict(data) for order_id, data in payload.items()}
+        except (ValueError, KeyError) as exc:
+            logger.warning("Failed to load persisted orders: %s", exc)
+            return {}
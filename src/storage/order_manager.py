@@ -0,0 +1,161 @@
+"""In-memory order book with JSON persistence and websocket notification."""
+
+import asyncio
+import inspect
+import logging
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Set
+
+from src.models.order import Order
+from src.storage.file_storage import FileStorage
+
+logger = logging.getLogger(__name__)
+
+
+def _sync_only(func):
+    """Mark a CPU-bound method as intentionally synchronous.
+
+    The in-memory book operations are plain dict work; wrapping them in
+    coroutines only adds event-loop scheduling overhead. This guard fails
+    fast if a refactor turns one of them into a coroutine, and callers
+    that ingest large batches should use ``asyncio.to_thread`` once per
+    batch instead of awaiting per item.
+    """
+    if inspect.iscoroutinefunction(func):
+        raise TypeError(f"{func.__qualname__} must stay synchronous (CPU-bound)")
+    # The guard fires at decoration time; returning the function unchanged
+    # keeps the hot read/write paths free of an extra call frame.
+    func.__sync_only__ = True
+    return func
+
+
+class OrderManager:
+    """Keeps the live set of orders and fans updates out to subscribers."""
+
+    def __init__(self, file_storage: FileStorage, order_notifier=None, config_manager=None) -> None:
+        self.file_storage = file_storage
+        self.order_notifier = order_notifier
+        self.config_manager = config_manager
+        self.orders: Dict[str, Order] = {}
+        # Secondary indexes kept in lockstep with ``orders`` so the common
+        # by-symbol / by-side / by-status reads are O(result) instead of a
+        # full scan of the book.
+        self._by_symbol: Dict[str, Dict[str, Order]] = defaultdict(dict)
+        self._by_side: Dict[str, Set[str]] = defaultdict(set)
+        self._by_status: Counter = Counter()
+        self._lock = asyncio.Lock()
+
+    async def initialize(self) -> None:
+        """Prepare storage and load any persisted orders."""
+        await self.file_storage.initialize()
+        loaded = await self.file_storage.load_orders()
+        self.clear()
+        for order in loaded.values():
+            self._index_order(order)
+
+    def _index_order(self, order: Order) -> None:
+        """Insert ``order`` into the book and all secondary indexes."""
+        previous = self.orders.get(order.id)
+        if previous is not None:
+            self._unindex_order(previous)
+        self.orders[order.id] = order
+        self._by_symbol[order.symbol][order.id] = order
+        self._by_side[order.side].add(order.id)
+        self._by_status[order.status] += 1
+
+    def _unindex_order(self, order: Order) -> None:
+        self._by_symbol[order.symbol].pop(order.id, None)
+        self._by_side[order.side].discard(order.id)
+        self._by_status[order.status] -= 1
+        if not self._by_status[order.status]:
+            del self._by_status[order.status]
+
+    @_sync_only
+    def add_order(self, order: Order) -> None:
+        """Insert an order into the in-memory book (no persistence)."""
+        self._index_order(order)
+
+    async def update_order(self, order: Order) -> None:
+        """Insert or update an order, persist, and notify subscribers."""
+        if not self._passes_symbol_config(order):
+            return
+        async with self._lock:
+            self._index_order(order)
+            await self.file_storage.save_orders(self.orders)
+        if self.order_notifier is not None:
+            await self.order_notifier.notify_order_update(order)
+
+    async def update_orders_bulk(self, orders: List[Order]) -> None:
+        """Insert or update a batch of orders with one persist and one notify.
+
+        Awaiting update_order per item pays lock acquisition, a disk write
+        and a notifier call for every order; the bulk path filters in a
+        tight loop, merges with a single dict.update and notifies once.
+        """
+        accepted = [order for order in orders if self._passes_symbol_config(order)]
+        if not accepted:
+            return
+        async with self._lock:
+            for order in accepted:
+                self._index_order(order)
+            await self.file_storage.save_orders(self.orders)
+        if self.order_notifier is not None:
+            await self.order_notifier.notify_orders_batch(accepted)
+
+    @_sync_only
+    def update_order_status(self, order_id: str, status: str) -> Optional[Order]:
+        """Change the status of a known order."""
+        order = self.orders.get(order_id)
+        if order is None:
+            return None
+        self._by_status[order.status] -= 1
+        if not self._by_status[order.status]:
+            del self._by_status[order.status]
+        order.status = status
+        self._by_status[status] += 1
+        return order
+
+    @_sync_only
+    def get_orders(self) -> List[Order]:
+        return list(self.orders.values())
+
+    @_sync_only
+    def get_order_by_id(self, order_id: str) -> Optional[Order]:
+        return self.orders.get(order_id)
+
+    @_sync_only
+    def get_order_count(self) -> int:
+        return len(self.orders)
+
+    def get_orders_by_symbol(self, symbol: str) -> List[Order]:
+        return list(self._by_symbol[symbol].values())
+
+    def get_orders_by_side(self, side: str) -> List[Order]:
+        return [self.orders[order_id] for order_id in self._by_side[side]]
+
+    def get_order_count_by_status(self) -> Dict[str, int]:
+        return dict(self._by_status)
+
+    def clear(self) -> None:
+        """Drop all in-memory orders."""
+        self.orders = {}
+        self._by_symbol = defaultdict(dict)
+        self._by_side = defaultdict(set)
+        self._by_status = Counter()
+
+    def _passes_symbol_config(self, order: Order) -> bool:
+        """Check the order against the per-symbol config, if one is loaded."""
+        if self.config_manager is None:
+            return True
+        try:
+            config = self.config_manager.get_config()
+        except RuntimeError:
+            return True
+        if not config.symbols_config:
+            return True
+        for symbol_config in config.symbols_config:
+            if symbol_config.symbol == order.symbol:
+                if not symbol_config.enabled:
+                    return False
+                return order.price * order.size >= symbol_config.min_liquidity
+        return False
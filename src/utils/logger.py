@@ -0,0 +1,55 @@
+"""Application logging setup and log directory maintenance."""
+
+import logging
+import time
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+from src.config.settings import settings
+
+LOG_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+DATE_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+
+def get_formatter() -> logging.Formatter:
+    """Return the formatter shared by all application handlers."""
+    return logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
+
+
+def setup_logger(name: str = "hypernode") -> logging.Logger:
+    """Configure a rotating file logger plus console output."""
+    logger = logging.getLogger(name)
+    if logger.handlers:
+        return logger
+    logger.setLevel(settings.LOG_LEVEL)
+
+    logs_dir = Path(settings.LOGS_PATH)
+    logs_dir.mkdir(parents=True, exist_ok=True)
+
+    file_handler = RotatingFileHandler(
+        logs_dir / f"{name}.log",
+        maxBytes=settings.LOG_MAX_SIZE_MB * 1024 * 1024,
+        backupCount=5,
+        encoding="utf-8",
+    )
+    file_handler.setFormatter(get_formatter())
+    logger.addHandler(file_handler)
+
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(get_formatter())
+    logger.addHandler(console_handler)
+    return logger
+
+
+def cleanup_old_logs(logs_dir, retention_days: int = 30) -> int:
+    """Delete log files older than ``retention_days``; return how many."""
+    logs_dir = Path(logs_dir)
+    if not logs_dir.exists():
+        return 0
+    cutoff = time.time() - retention_days * 86400
+    removed = 0
+    for path in logs_dir.glob("*.log*"):
+        if path.is_file() and path.stat().st_mtime < cutoff:
+            path.unlink()
+            removed += 1
+    return removed
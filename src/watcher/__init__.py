@@ -0,0 +1,3 @@
+from src.watcher.reactive_order_watcher import ReactiveOrderWatcher
+
+__all__ = ["ReactiveOrderWatcher"]
@@ -0,0 +1,145 @@
+"""Reactive matching of incoming orders against external search requests."""
+
+import asyncio
+import functools
+import logging
+from collections import defaultdict, deque
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from src.models.order import Order
+
+logger = logging.getLogger(__name__)
+
+# How far apart (seconds) a request and an order may be to match.
+MATCH_WINDOW_SECONDS = 2.0
+# Same window in integer nanoseconds; the matcher compares ints instead of
+# allocating a timedelta per candidate.
+MATCH_WINDOW_NS = int(MATCH_WINDOW_SECONDS * 1_000_000_000)
+
+# Per-symbol cache depth; older orders fall out as new ones arrive.
+ORDERS_CACHE_MAXLEN = 10_000
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_iso(timestamp: str) -> datetime:
+    """Parse an ISO 8601 timestamp, accepting the trailing-Z form.
+
+    Requests arriving in the same second carry identical timestamp strings,
+    so the cache turns repeat parses into a dict lookup.
+    """
+    return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+
+
+class ReactiveOrderWatcher:
+    """Matches orders arriving from the parser against active search requests.
+
+    Search requests come in over NATS with a ticker, side and timestamp;
+    the watcher keeps a short cache of recent orders per symbol and picks
+    the best matching order for each request.
+    """
+
+    def __init__(
+        self, config_manager, order_manager, nats_client=None, websocket_manager=None
+    ) -> None:
+        self.config_manager = config_manager
+        self.order_manager = order_manager
+        self.nats_client = nats_client
+        self.websocket_manager = websocket_manager
+        # Requests bucketed by (ticker, side); "" groups sideless requests
+        # that match either side. An order only ever touches two buckets.
+        self._requests_by_key: Dict[Tuple[str, str], List[dict]] = defaultdict(list)
+        # Read-only copy of the buckets, swapped in atomically after every
+        # write; the matcher reads it without taking the lock.
+        self._req_snapshot: Dict[Tuple[str, str], tuple] = {}
+        # Bounded deques: O(1) append with automatic eviction keeps the
+        # watcher's memory flat however long it runs.
+        self.orders_cache: Dict[str, deque] = defaultdict(
+            lambda: deque(maxlen=ORDERS_CACHE_MAXLEN)
+        )
+        self._lock = asyncio.Lock()
+        # Symbol rules indexed by symbol, rebuilt when the config object
+        # handed out by the manager changes (e.g. after a NATS refresh).
+        self._symbol_cfg: Dict[str, object] = {}
+        self._indexed_config = None
+
+    @property
+    def active_requests(self) -> List[dict]:
+        """Flat view over all request buckets."""
+        return [req for bucket in self._requests_by_key.values() for req in bucket]
+
+    async def add_search_request(self, request: dict) -> bool:
+        """Register a search request; returns False if its timestamp is invalid."""
+        try:
+            request_ts = _parse_iso(request["timestamp"])
+        except (KeyError, ValueError) as exc:
+            logger.warning("Search request with invalid timestamp dropped: %s", exc)
+            return False
+        async with self._lock:
+            request = dict(request)
+            request["ts_ns"] = int(request_ts.timestamp() * 1_000_000_000)
+            key = (request.get("ticker"), request.get("side") or "")
+            self._requests_by_key[key].append(request)
+            self._req_snapshot = {
+                k: tuple(bucket) for k, bucket in self._requests_by_key.items()
+            }
+        return True
+
+    async def process_order(self, order: Order) -> None:
+        """Cache an incoming order and answer any matching requests."""
+        if not self._check_order_configuration(order):
+            return
+        self._add_order_to_cache(order)
+        matches = await self._find_matching_requests(order)
+        for request in matches:
+            candidates = self.orders_cache.get(order.symbol, [])
+            best = self._select_best_order(candidates, request)
+            if best is not None:
+                await self._respond(request, best)
+
+    def _add_order_to_cache(self, order: Order) -> None:
+        """Append an order to the per-symbol cache."""
+        self.orders_cache[order.symbol].append(order)
+
+    async def _find_matching_requests(self, order: Order) -> List[dict]:
+        """Find active requests matching the order's ticker, side and time window."""
+        matches = []
+        order_ts_ns = int(order.timestamp.timestamp() * 1_000_000_000)
+        # Writers swap in a fresh snapshot under the lock; binding it to a
+        # local here is atomic, so the hot path never waits on writers.
+        snapshot = self._req_snapshot
+        for key in ((order.symbol, order.side), (order.symbol, "")):
+            for request in snapshot.get(key, ()):
+                if abs(request["ts_ns"] - order_ts_ns) > MATCH_WINDOW_NS:
+                    continue
+                matches.append(request)
+        return matches
+
+    def _select_best_order(self, orders: List[Order], request: dict) -> Optional[Order]:
+        """Pick the order with the highest notional, preferring open orders."""
+        open_orders = [order for order in orders if order.status == "open"]
+        if open_orders:
+            return max(open_orders, key=lambda order: order.price * order.size)
+        return max(orders, key=lambda order: order.price * order.size, default=None)
+
+    def _check_order_configuration(self, order: Order) -> bool:
+        """Check the order against the configured symbol rules."""
+        config = self.config_manager.get_config()
+        if config is not self._indexed_config:
+            self._symbol_cfg = {cfg.symbol: cfg for cfg in config.symbols_config}
+            self._indexed_config = config
+        symbol_config = self._symbol_cfg.get(order.symbol)
+        if symbol_config is None or not symbol_config.enabled:
+            return False
+        return order.price * order.size >= symbol_config.min_liquidity
+
+    async def _respond(self, request: dict, order: Order) -> None:
+        """Publish the matched order to NATS and websocket subscribers."""
+        if self.nats_client is not None:
+            await self.nats_client.publish_order_data(
+                order.to_dict(), topic=request.get("reply_to")
+            )
+        if self.websocket_manager is not None:
+            await self.websocket_manager.broadcast(
+                {"type": "order_match", "order": order.to_dict()}
+            )
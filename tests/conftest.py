@@ -0,0 +1,100 @@
+"""Shared pytest configuration and fixtures for the suite."""
+
+import asyncio
+import logging
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+
+from src.api.order_notifier import OrderNotifier
+from src.api.websocket_manager import WebSocketManager
+from src.storage.config_manager import ConfigManager
+from src.storage.file_storage import FileStorage
+from src.storage.order_manager import OrderManager
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional speedup
+    uvloop = None
+
+# Settings attributes that do not depend on the per-test tmp directory.
+_SETTINGS_DEFAULTS = {
+    "API_HOST": "127.0.0.1",
+    "API_PORT": 8000,
+    "LOG_LEVEL": "INFO",
+    "LOG_MAX_SIZE_MB": 50,
+    "LOG_RETENTION_DAYS": 30,
+    "WS_MAX_CONNECTIONS": 100,
+    "NATS_URL": "nats://localhost:4222",
+    "NATS_CREDS_FILE": "",
+    "NATS_SUBJECT_PREFIX": "orders",
+    "MIN_LIQUIDITY": 0.0,
+    "CONFIG_REFRESH_INTERVAL": 60,
+}
+
+
+# The notifier and websocket manager carry no per-test state (no client is
+# ever connected in these tests), so one instance serves the whole module.
+_WS_MANAGER = WebSocketManager()
+_ORDER_NOTIFIER = OrderNotifier(_WS_MANAGER, None)
+
+
+@pytest_asyncio.fixture
+async def initialized_order_manager(tmp_path, monkeypatch):
+    """(order_manager, config_manager) pair wired together over tmp_path.
+
+    Replaces the per-test `with patch(...)` blocks that assigned fourteen
+    attributes on a MagicMock; a plain SimpleNamespace is swapped in via
+    monkeypatch and the config is loaded once. The config manager is
+    loaded before the OrderManager is built and handed to it, so
+    update_order/update_orders_bulk run the symbol-config filter exactly
+    as in production.
+    """
+    settings_ns = SimpleNamespace(
+        NODE_LOGS_PATH=str(tmp_path / "logs"),
+        DATA_PATH=str(tmp_path / "data"),
+        LOGS_PATH=str(tmp_path / "logs"),
+        **_SETTINGS_DEFAULTS,
+    )
+    monkeypatch.setattr("src.storage.config_manager.settings", settings_ns)
+    config_manager = ConfigManager()
+    await config_manager.load_config_async()
+    file_storage = FileStorage()
+    file_storage.data_dir = tmp_path / "order_data"
+    file_storage.data_dir.mkdir()
+    manager = OrderManager(file_storage, _ORDER_NOTIFIER, config_manager)
+    await manager.initialize()
+    yield manager, config_manager
+    manager.clear()
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _silence_nats_logs():
+    """Mute src.nats logging for the whole run.
+
+    The retry tests drive full failure loops on purpose; without this the
+    handler formats and writes a warning to stderr for every forced retry.
+    """
+    nats_logger = logging.getLogger("src.nats")
+    nats_logger.disabled = True
+    yield
+    nats_logger.disabled = False
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run all async tests on uvloop when it is available.
+
+    The libuv-based loop fast-paths ready coroutines and issues far fewer
+    syscalls per await than the default selector loop, which shows up
+    directly in the await-heavy integration and NATS tests.
+
+    Overriding this fixture is deprecated by newer pytest-asyncio in
+    favour of a loop-factories hook; the plugin is pinned <2.0 in
+    requirements-dev.txt and the warning is ignored in pytest.ini until
+    the wiring is migrated.
+    """
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
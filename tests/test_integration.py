@@ -0,0 +1,211 @@
+"""End-to-end tests: log parsing -> order manager -> storage.
+
+Note: ``OrderManager.add_order`` and the read helpers are deliberately
+synchronous (guarded by ``_sync_only``) — they are pure dict work, and the
+only async boundary in the manager is the file I/O in ``update_order``.
+Call them without ``await``; for big batches, offload once per batch via
+``asyncio.to_thread`` rather than per item.
+"""
+
+import time
+from collections import defaultdict
+from itertools import cycle, islice
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.models.order import Order
+from src.parser.log_parser import LogParser
+from src.parser.order_extractor import OrderExtractor
+from src.storage.order_manager import OrderManager
+
+# Pre-serialized log fixture: four valid orders plus one noise line. The
+# content is known ahead of time, so it is kept as a single bytes literal
+# instead of being re-assembled from Python strings in every setup_method.
+_TEST_LOG_BLOB = (
+    b'{"time": "2025-09-02T08:26:36.877863946", "user": "0x1234567890abcdef1234567890abcdef12345678", "status": "open", "order": {"coin": "BTC", "side": "B", "limitPx": "50000", "origSz": "1.0", "oid": 1001}}\n'
+    b'{"time": "2025-09-02T08:26:37.100000000", "user": "0x1234567890abcdef1234567890abcdef12345678", "status": "open", "order": {"coin": "BTC", "side": "A", "limitPx": "51000", "origSz": "0.5", "oid": 1002}}\n'
+    b'invalid json line\n'
+    b'{"time": "2025-09-02T08:26:38.200000000", "user": "0xfedcba0987654321fedcba0987654321fedcba09", "status": "open", "order": {"coin": "ETH", "side": "B", "limitPx": "3000", "origSz": "2.0", "oid": 1003}}\n'
+    b'{"time": "2025-09-02T08:26:39.300000000", "user": "0xfedcba0987654321fedcba0987654321fedcba09", "status": "open", "order": {"coin": "SOL", "side": "A", "limitPx": "100", "origSz": "10.0", "oid": 1004}}\n'
+)
+
+# Timedelta lookup table for the perf-test timestamps: built once at import
+# so repeated runs pay one datetime.now() plus 1000 additions, nothing more.
+_TD_LUT = [timedelta(seconds=i) for i in range(1000)]
+
+
+class TestIntegration:
+    """Exercises the full pipeline against a temporary directory tree."""
+
+    @pytest.fixture(autouse=True)
+    def _paths(self, tmp_path):
+        # tmp_path is created per test and cleaned up lazily by pytest's
+        # tmpdir policy — no recursive rmtree on every teardown.
+        self.temp_dir = tmp_path
+        self.data_dir = tmp_path / "data"
+        self.data_dir.mkdir()
+        self.logs_dir = tmp_path / "logs"
+        self.logs_dir.mkdir()
+        self.test_log_file = self.logs_dir / "test.log"
+        self.create_test_log_file()
+
+    def create_test_log_file(self):
+        """Write the pre-serialized node log fixture."""
+        self.test_log_file.write_bytes(_TEST_LOG_BLOB)
+
+    async def test_complete_workflow(self, initialized_order_manager):
+        order_manager, config_manager = initialized_order_manager
+        await config_manager.update_config_async(
+            {
+                "symbols_config": [
+                    {"symbol": "BTC", "min_liquidity": 0, "enabled": True},
+                    {"symbol": "ETH", "min_liquidity": 0, "enabled": True},
+                    {"symbol": "SOL", "min_liquidity": 0, "enabled": True},
+                ]
+            }
+        )
+
+        log_parser = LogParser()
+        orders = log_parser.parse_file(str(self.test_log_file))
+        assert len(orders) == 4
+
+        for order in orders:
+            await order_manager.update_order(order)
+        assert order_manager.get_order_count() == 4
+
+        # The wired-in config filter drops symbols missing from the list.
+        rejected = Order(
+            id="9999",
+            symbol="DOGE",
+            side="Bid",
+            price=1.0,
+            size=1.0,
+            owner="0x1234567890abcdef1234567890abcdef12345678",
+            timestamp=datetime.now(),
+            status="open",
+        )
+        await order_manager.update_order(rejected)
+        assert order_manager.get_order_by_id("9999") is None
+
+        # Bucket in one pass instead of filtering once per symbol.
+        buckets = defaultdict(list)
+        for o in order_manager.get_orders():
+            buckets[o.symbol].append(o)
+        assert len(buckets["BTC"]) == 2
+        assert len(buckets["ETH"]) == 1
+        assert len(buckets["SOL"]) == 1
+        btc_orders = buckets["BTC"]
+
+        by_key = {(o.side, o.price): o for o in btc_orders}
+        btc_bid_order = by_key[("Bid", 50000.0)]
+        assert btc_bid_order.size == 1.0
+        assert btc_bid_order.owner == "0x1234567890abcdef1234567890abcdef12345678"
+
+    async def test_performance_with_large_dataset(self, initialized_order_manager):
+        order_manager, config_manager = initialized_order_manager
+
+        # Precompute the per-order fields and drive the constructions from
+        # zip instead of branching and formatting inside the loop body.
+        base_ts = datetime.now()  # one clock read instead of 1000
+        ids = [str(i) for i in range(1000)]
+        symbols = islice(cycle(["BTC", "ETH"]), 1000)
+        sides = islice(cycle(["Bid", "Ask", "Ask"]), 1000)
+        owners = [f"0x{i:040x}" for i in range(1000)]
+        timestamps = [base_ts + td for td in _TD_LUT]
+        orders = [
+            Order(
+                id=order_id,
+                symbol=symbol,
+                side=side,
+                price=50000.0 + i,
+                size=1.0 + i * 0.001,
+                owner=owner,
+                timestamp=ts,
+                status="open",
+            )
+            for i, (order_id, symbol, side, owner, ts) in enumerate(
+                zip(ids, symbols, sides, owners, timestamps)
+            )
+        ]
+
+        start_time = time.time()
+        batch_size = 100
+        for batch_start in range(0, len(orders), batch_size):
+            batch = orders[batch_start : batch_start + batch_size]
+            await order_manager.update_orders_bulk(batch)
+        duration = time.time() - start_time
+        assert duration < 30.0
+
+        assert order_manager.get_order_count() == 1000
+        assert len(order_manager.get_orders_by_symbol("BTC")) == 500
+        side_buckets = defaultdict(list)
+        for o in order_manager.get_orders():
+            side_buckets[o.side].append(o)
+        assert len(side_buckets["Bid"]) == 334
+        assert order_manager.get_order_count_by_status() == {"open": 1000}
+
+        retrieved_order = order_manager.get_order_by_id("500")
+        assert retrieved_order.symbol == "BTC"
+        assert retrieved_order.side == "Ask"
+
+    async def test_error_handling_and_recovery(self):
+        order_extractor = OrderExtractor()
+
+        invalid_order_data = {
+            "time": "2025-09-02T08:26:36.877863946",
+            "user": "0x1234567890abcdef1234567890abcdef12345678",
+            "status": "open",
+            "order": {
+                "coin": "BTC",
+                "side": "InvalidSide",
+                "limitPx": "50000",
+                "origSz": "1.0",
+                "oid": 9001,
+            },
+        }
+        assert order_extractor.extract_order(invalid_order_data) is None
+
+        missing_order_field = {
+            "time": "2025-09-02T08:26:36.877863946",
+            "user": "0x1234567890abcdef1234567890abcdef12345678",
+            "status": "open",
+        }
+        assert order_extractor.extract_order(missing_order_field) is None
+
+        # The parser recovers from bad lines and keeps the good ones.
+        log_parser = LogParser()
+        orders = log_parser.parse_file(str(self.test_log_file))
+        assert len(orders) == 4
+
+    async def test_order_status_transitions(self, initialized_order_manager):
+        order_manager, config_manager = initialized_order_manager
+
+        log_parser = LogParser()
+        orders = log_parser.parse_file(str(self.test_log_file))
+        for order in orders:
+            order_manager.add_order(order)
+
+        order_manager.update_order_status("1001", "filled")
+        assert order_manager.get_order_by_id("1001").status == "filled"
+
+        order_manager.update_order_status("1002", "canceled")
+        counts = order_manager.get_order_count_by_status()
+        assert counts == {"open": 2, "filled": 1, "canceled": 1}
+
+        assert order_manager.update_order_status("missing", "filled") is None
+
+    async def test_orders_persisted_and_reloaded(self, initialized_order_manager):
+        order_manager, config_manager = initialized_order_manager
+
+        log_parser = LogParser()
+        for order in log_parser.parse_file(str(self.test_log_file)):
+            await order_manager.update_order(order)
+        assert order_manager.get_order_count() == 4
+
+        reloaded_manager = OrderManager(
+            order_manager.file_storage, order_manager.order_notifier
+        )
+        await reloaded_manager.initialize()
+        assert reloaded_manager.get_order_count() == 4
+        assert reloaded_manager.get_order_by_id("1001").symbol == "BTC"
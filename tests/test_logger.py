@@ -0,0 +1,64 @@
+"""Tests for logging setup and log directory maintenance."""
+
+import logging
+import time
+
+import pytest
+
+from src.utils.logger import cleanup_old_logs, get_formatter
+
+
+class TestLogger:
+    @pytest.fixture(autouse=True)
+    def _paths(self, tmp_path):
+        self.temp_dir = tmp_path
+        self.logs_dir = tmp_path / "logs"
+        self.logs_dir.mkdir()
+
+    def test_logger_formatter_includes_timestamp_and_level(self):
+        formatter = get_formatter()
+        # A real LogRecord takes the same fast path production records do,
+        # instead of bouncing every attribute read through Mock.__getattr__.
+        record = logging.LogRecord(
+            name="test_logger",
+            level=logging.INFO,
+            pathname="",
+            lineno=0,
+            msg="Test message",
+            args=(),
+            exc_info=None,
+        )
+        formatted = formatter.format(record)
+        assert "INFO" in formatted
+        assert "test_logger" in formatted
+        assert "Test message" in formatted
+
+    def test_cleanup_old_logs_removes_old_files(self, monkeypatch):
+        old_file = self.logs_dir / "old.log"
+        old_file.write_text("old log")
+        recent_file = self.logs_dir / "recent.log"
+        recent_file.write_text("recent log")
+
+        # Fresh files survive a run at the real clock.
+        assert cleanup_old_logs(self.logs_dir, retention_days=30) == 0
+        assert old_file.exists() and recent_file.exists()
+
+        # Fast-forward the clock the cleanup reads instead of rewinding
+        # file mtimes with os.utime; both files are now past retention.
+        fake_now = time.time() + 31 * 86400
+        monkeypatch.setattr("src.utils.logger.time.time", lambda: fake_now)
+        removed = cleanup_old_logs(self.logs_dir, retention_days=30)
+        assert removed == 2
+        assert not old_file.exists()
+        assert not recent_file.exists()
+
+    def test_cleanup_old_logs_missing_directory(self):
+        assert cleanup_old_logs(self.temp_dir / "nope", retention_days=30) == 0
+
+    def test_cleanup_old_logs_ignores_non_log_files(self, monkeypatch):
+        other = self.logs_dir / "notes.txt"
+        other.write_text("keep me")
+        fake_now = time.time() + 31 * 86400
+        monkeypatch.setattr("src.utils.logger.time.time", lambda: fake_now)
+        assert cleanup_old_logs(self.logs_dir, retention_days=30) == 0
+        assert other.exists()
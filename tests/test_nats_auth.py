@@ -0,0 +1,88 @@
+"""Unit tests for JWT credential loading."""
+
+import re
+from types import MappingProxyType
+from unittest.mock import mock_open, patch
+
+import orjson
+import pytest
+
+from src.nats.auth import JWTAuth
+
+# Canonical valid credentials, serialized once for every test that needs them.
+# Read-only view so no test (or xdist worker) can mutate the shared dict.
+TEST_CREDS = MappingProxyType(
+    {"jwt": "test_jwt_token", "seed": "test_seed_value", "user": "parser"}
+)
+TEST_CREDS_BYTES = orjson.dumps(dict(TEST_CREDS))
+
+# Compiled once; re.search inside pytest.raises(match=...) accepts patterns.
+ERR_BAD_JSON = re.compile("Некорректный JSON")
+ERR_NOT_FOUND = re.compile("Файл учётных данных не найден")
+
+
+class TestJWTAuth:
+    @pytest.fixture
+    def auth(self):
+        return JWTAuth()
+
+    # One state-machine test instead of per-flag smoke tests: run an action
+    # (or none) and assert the resulting loaded/authenticated flags.
+    @pytest.mark.parametrize(
+        "action,loaded,authenticated",
+        [
+            pytest.param(None, False, False, id="init"),
+            pytest.param("load", True, False, id="after-load"),
+            pytest.param("authenticate", False, True, id="after-authenticate"),
+        ],
+    )
+    def test_state_transitions(self, auth, action, loaded, authenticated):
+        if action == "load":
+            with patch("builtins.open", mock_open(read_data=TEST_CREDS_BYTES)):
+                auth.load_credentials("creds.json")
+        elif action == "authenticate":
+            auth.mark_authenticated()
+        else:
+            assert auth.jwt is None
+            assert auth.seed is None
+            assert auth.user is None
+        assert auth.is_loaded() is loaded
+        assert auth.is_authenticated() is authenticated
+
+    # (payload, expected exception, message pattern) — one case per former
+    # copy-pasted test body; None payload means non-JSON file contents.
+    LOAD_CASES = [
+        pytest.param(TEST_CREDS, None, None, id="success"),
+        pytest.param(None, ValueError, ERR_BAD_JSON, id="invalid-json"),
+        pytest.param(
+            {"seed": "test_seed_value", "user": "parser"},
+            ValueError,
+            re.compile("Отсутствует поле 'jwt'"),
+            id="missing-jwt",
+        ),
+        pytest.param(
+            {"jwt": "test_jwt_token", "user": "parser"},
+            ValueError,
+            re.compile("Отсутствует поле 'seed'"),
+            id="missing-seed",
+        ),
+    ]
+
+    @pytest.mark.parametrize("creds,exc,match", LOAD_CASES)
+    def test_load_credentials(self, auth, creds, exc, match):
+        payload = (
+            orjson.dumps(dict(creds)) if creds is not None else b"invalid json content"
+        )
+        with patch("builtins.open", mock_open(read_data=payload)):
+            if exc is None:
+                auth.load_credentials("creds.json")
+                assert auth.jwt == "test_jwt_token"
+                assert auth.seed == "test_seed_value"
+                assert auth.user == "parser"
+            else:
+                with pytest.raises(exc, match=match):
+                    auth.load_credentials("creds.json")
+
+    def test_load_credentials_file_not_found(self, auth):
+        with pytest.raises(FileNotFoundError, match=ERR_NOT_FOUND):
+            auth.load_credentials("/nonexistent/creds.json")
@@ -0,0 +1,79 @@
+"""Unit tests for NATSClient connection lifecycle."""
+
+import re
+from unittest.mock import AsyncMock, mock_open, patch
+
+import pytest
+from nats.aio.client import Client as NATS
+
+from src.nats.nats_client import NATSClient
+from tests.test_nats_auth import ERR_BAD_JSON, TEST_CREDS_BYTES
+
+ERR_CONNECT = re.compile("Не удалось подключиться к NATS")
+
+
+class TestNATSClient:
+    def setup_method(self):
+        self.client = NATSClient()
+
+    @pytest.fixture(autouse=True)
+    def nats_connect(self):
+        """One nats.connect patch per test, instead of a with-block per body."""
+        with patch("nats.connect", new_callable=AsyncMock) as mock_connect:
+            # spec= keeps attribute lookups on a fixed table instead of
+            # materializing a new child mock per attribute access.
+            mock_connect.return_value = AsyncMock(spec=NATS)
+            yield mock_connect
+
+    # Connect / disconnect state machine in one parametrized test.
+    @pytest.mark.parametrize(
+        "disconnect,connected",
+        [
+            pytest.param(False, True, id="after-connect"),
+            pytest.param(True, False, id="after-disconnect"),
+        ],
+    )
+    async def test_connection_state(self, nats_connect, disconnect, connected):
+        assert self.client.is_connected is False
+        await self.client.connect()
+        if disconnect:
+            await self.client.disconnect()
+            nats_connect.return_value.close.assert_called_once()
+        else:
+            nats_connect.assert_called_once()
+        assert self.client.is_connected is connected
+
+    async def test_connect_failure(self, nats_connect):
+        nats_connect.side_effect = Exception("connection refused")
+        with pytest.raises(ConnectionError, match=ERR_CONNECT):
+            await self.client.connect()
+        assert self.client.is_connected is False
+
+    async def test_context_manager(self):
+        async with self.client as client:
+            assert client.is_connected is True
+        assert self.client.is_connected is False
+
+    async def test_connect_with_jwt_credentials(self):
+        with patch("builtins.open", mock_open(read_data=TEST_CREDS_BYTES)):
+            await self.client.connect(creds_file="creds.json")
+        assert self.client.auth.is_loaded() is True
+        assert self.client.is_connected is True
+
+    @pytest.mark.parametrize(
+        "payload,exc,match",
+        [
+            pytest.param(TEST_CREDS_BYTES, None, None, id="success"),
+            pytest.param(
+                b"invalid json content", ValueError, ERR_BAD_JSON, id="invalid-json"
+            ),
+        ],
+    )
+    def test_load_credentials(self, payload, exc, match):
+        with patch("builtins.open", mock_open(read_data=payload)):
+            if exc is None:
+                self.client.auth.load_credentials("creds.json")
+                assert self.client.auth.is_loaded() is True
+            else:
+                with pytest.raises(exc, match=match):
+                    self.client.auth.load_credentials("creds.json")
@@ -0,0 +1,107 @@
+"""Tests for NATSClient retry and error handling behaviour."""
+
+import re
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from nats.aio.client import Client as NATS
+
+from src.nats.nats_client import NATSClient
+
+# Frozen timestamp: the tests care about field presence, not wall-clock.
+FIXED_TS = datetime(2024, 1, 1)
+
+# Compiled once; re.search inside pytest.raises(match=...) accepts patterns.
+ERR_PUBLISH = re.compile("Не удалось опубликовать сообщение в NATS")
+ERR_RECONNECT = re.compile("Не удалось переподключиться к NATS")
+ERR_MISSING_FIELD = re.compile("Отсутствует обязательное поле")
+
+
+class TestNATSErrorHandling:
+    @pytest.fixture
+    def client(self):
+        client = NATSClient(max_retry_attempts=3, retry_delay=0.1)
+        client._nc = AsyncMock(spec=NATS)
+        client._is_connected = True
+        return client
+
+    @pytest.fixture(autouse=True)
+    def mock_sleep(self):
+        # No-op the backoff sleeps: the delay sequence is asserted on the
+        # mock instead of being waited out in real time.
+        with patch(
+            "src.nats.nats_client.asyncio.sleep", new_callable=AsyncMock
+        ) as mock_sleep:
+            yield mock_sleep
+
+    @pytest.fixture
+    def order_data(self):
+        return {
+            "id": "12345",
+            "symbol": "BTC",
+            "side": "Bid",
+            "price": 50000.0,
+            "size": 1.0,
+            "owner": "0x1234567890abcdef1234567890abcdef12345678",
+            "timestamp": FIXED_TS,
+            "status": "open",
+        }
+
+    async def test_publish_with_retry_success_first_attempt(self, client, order_data):
+        await client.publish_order_data(order_data)
+        client._nc.publish.assert_called_once()
+
+    async def test_publish_with_retry_success_after_failures(self, client, order_data):
+        client._nc.publish.side_effect = [
+            Exception("fail 1"),
+            Exception("fail 2"),
+            None,
+        ]
+        await client.publish_order_data(order_data)
+        assert client._nc.publish.call_count == 3
+
+    async def test_publish_with_retry_all_attempts_failed(self, client, order_data):
+        client._nc.publish.side_effect = Exception("always fails")
+        with pytest.raises(ConnectionError, match=ERR_PUBLISH):
+            await client.publish_order_data(order_data)
+        assert client._nc.publish.call_count == 3
+
+    async def test_reconnect_with_retry_all_attempts_failed(self, client):
+        with patch("nats.connect", new_callable=AsyncMock) as mock_connect:
+            mock_connect.side_effect = Exception("no route")
+            with pytest.raises(ConnectionError, match=ERR_RECONNECT):
+                await client._reconnect_with_retry()
+            assert mock_connect.call_count == 3
+
+    async def test_exponential_backoff_timing(self, client, order_data, mock_sleep):
+        client._nc.publish.side_effect = [
+            Exception("fail 1"),
+            Exception("fail 2"),
+            None,
+        ]
+        await client.publish_order_data(order_data)
+        # Two failures mean two backoff sleeps following delay * 2**attempt.
+        requested = [sleep.args[0] for sleep in mock_sleep.await_args_list]
+        assert requested == [client.retry_delay * 2**attempt for attempt in range(2)]
+
+    async def test_error_metrics_after_failure(self, client, order_data):
+        client._nc.publish.side_effect = Exception("always fails")
+        with pytest.raises(ConnectionError):
+            await client.publish_order_data(order_data)
+        metrics = client.get_metrics()
+        assert metrics["messages"]["total_errors"] >= 1
+
+    async def test_publish_invalid_order_raises(self, client, order_data):
+        del order_data["status"]
+        with pytest.raises(ValueError, match=ERR_MISSING_FIELD):
+            await client.publish_order_data(order_data)
+        client._nc.publish.assert_not_called()
+
+    async def test_error_recovery(self, client, order_data):
+        client._nc.publish = AsyncMock(side_effect=Exception("down"))
+        with pytest.raises(ConnectionError):
+            await client.publish_order_data(order_data)
+        client._nc.publish = AsyncMock()
+        await client.publish_order_data(order_data)
+        client._nc.publish.assert_called_once()
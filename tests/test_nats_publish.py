@@ -0,0 +1,160 @@
+"""Tests for publish_order_data: validation, formatting and subjects."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import orjson
+import pytest
+
+from src.nats.nats_client import NATSClient
+
+# Frozen wall clock: none of these tests assert against real time, and a
+# fixed value keeps payload comparisons reproducible.
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+# Valid order shared by the validation cases; each test copies and mutates
+# one field instead of re-spelling all eight.
+BASE_ORDER = {
+    "id": "1",
+    "symbol": "BTC",
+    "side": "Bid",
+    "price": 50000.0,
+    "size": 1.0,
+    "owner": "0xabc",
+    "timestamp": NOW,
+    "status": "open",
+}
+
+# Marks a field that should be removed rather than replaced.
+_OMIT = object()
+
+
+@pytest.fixture(scope="module")
+def shared_client():
+    """One client and one AsyncMock for the whole module.
+
+    Constructing NATSClient plus a fresh mock per test repeated the same
+    import and spec work for every method; the per-test fixture below
+    only resets the recorded calls.
+    """
+    client = NATSClient()
+    client._nc = AsyncMock()
+    client._is_connected = True
+    return client
+
+
+@pytest.fixture
+def client(shared_client):
+    shared_client._nc.reset_mock()
+    shared_client._nc.publish.side_effect = None
+    return shared_client
+
+
+class TestNATSPublish:
+    async def test_publish_order_data_success(self, client):
+        order_data = {
+            "id": "12345",
+            "symbol": "BTC",
+            "side": "Bid",
+            "price": 50000.0,
+            "size": 1.5,
+            "owner": "0x1234567890abcdef1234567890abcdef12345678",
+            "timestamp": NOW,
+            "status": "open",
+        }
+        await client.publish_order_data(order_data)
+        client._nc.publish.assert_called_once()
+        # One call_args read; each attribute access walks Mock machinery.
+        (topic, message), _kwargs = client._nc.publish.call_args
+        assert topic == "orders.BTC"
+        data = orjson.loads(message)
+        assert data["id"] == "12345"
+        assert data["timestamp"] == "2024-01-01T12:00:00Z"
+
+    async def test_publish_order_data_default_topic(self, client):
+        order_data = {
+            "id": "1",
+            "symbol": "ETH",
+            "side": "Ask",
+            "price": 3000.0,
+            "size": 2.0,
+            "owner": "0xabc",
+            "timestamp": NOW,
+            "status": "open",
+        }
+        await client.publish_order_data(order_data)
+        (topic, _payload), _kwargs = client._nc.publish.call_args
+        assert topic == "orders.ETH"
+
+    async def test_publish_order_data_custom_topic(self, client):
+        order_data = {
+            "id": "1",
+            "symbol": "ETH",
+            "side": "Ask",
+            "price": 3000.0,
+            "size": 2.0,
+            "owner": "0xabc",
+            "timestamp": NOW,
+            "status": "open",
+        }
+        await client.publish_order_data(order_data, topic="custom.subject")
+        (topic, _payload), _kwargs = client._nc.publish.call_args
+        assert topic == "custom.subject"
+
+    async def test_enqueue_order_data_batched(self, client):
+        num_messages = 100
+        for i in range(num_messages):
+            await client.enqueue_order_data({**BASE_ORDER, "id": str(i)})
+        await client.drain_send_queue()
+        assert client._nc.publish.await_count == num_messages
+        # The workers drain the backlog in batches, so the whole run needs
+        # far fewer flushes than messages.
+        assert 1 <= client._nc.flush.await_count < num_messages
+        await client._stop_sender_workers()
+
+    @pytest.mark.parametrize(
+        "field,value,msg",
+        [
+            pytest.param(
+                "status", _OMIT, "Отсутствует обязательное поле", id="missing-field"
+            ),
+            pytest.param(
+                "side", "invalid", "Поле 'side' должно быть Bid или Ask", id="invalid-side"
+            ),
+            pytest.param(
+                "price",
+                -50000.0,
+                "Поле 'price' должно быть положительным числом",
+                id="negative-price",
+            ),
+            pytest.param(
+                "price",
+                0,
+                "Поле 'price' должно быть положительным числом",
+                id="zero-price",
+            ),
+            pytest.param(
+                "size",
+                -1.0,
+                "Поле 'size' должно быть положительным числом",
+                id="negative-size",
+            ),
+            pytest.param("status", "unknown", "Недопустимый статус", id="invalid-status"),
+        ],
+    )
+    async def test_validate_order_data_rejects(self, client, field, value, msg):
+        order_data = dict(BASE_ORDER)
+        if value is _OMIT:
+            del order_data[field]
+        else:
+            order_data[field] = value
+        with pytest.raises(ValueError, match=msg):
+            await client.publish_order_data(order_data)
+
+    @pytest.mark.parametrize(
+        "raw_side,expected",
+        [("bid", "Bid"), ("Bid", "Bid"), ("ask", "Ask"), ("Ask", "Ask")],
+    )
+    def test_format_order_data_side_normalization(self, client, raw_side, expected):
+        formatted = client._format_order_data({**BASE_ORDER, "side": raw_side})
+        assert formatted["side"] == expected
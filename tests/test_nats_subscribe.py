@@ -0,0 +1,90 @@
+"""Tests for the config subscription path of NATSClient."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import orjson
+
+import pytest
+
+from src.nats.nats_client import NATSClient
+
+# Config payloads serialized once per module; the handler tests only care
+# about the bytes, not about re-encoding them for every test.
+GOOD_CFG = {"symbols": ["BTC", "ETH"], "min_liquidity": 1000.0}
+GOOD_CFG_BYTES = orjson.dumps(GOOD_CFG)
+EMPTY_CFG_BYTES = orjson.dumps({})
+SYMBOLS_ONLY_CFG_BYTES = orjson.dumps({"symbols": ["BTC"]})
+BAD_JSON_BYTES = b"invalid json"
+
+
+@pytest.fixture(scope="module")
+def shared_client():
+    """Module-wide client; per-test construction repeated identical work."""
+    client = NATSClient()
+    client._nc = AsyncMock()
+    client._is_connected = True
+    return client
+
+
+@pytest.fixture
+def client(shared_client):
+    if shared_client._nc is None:  # a disconnect test dropped the connection
+        shared_client._nc = AsyncMock()
+    else:
+        shared_client._nc.reset_mock()
+    shared_client._config_subscription = None
+    shared_client._config_callback = None
+    shared_client._is_connected = True
+    return shared_client
+
+
+class TestNATSSubscribe:
+    async def test_subscribe_to_config(self, client):
+        callback = AsyncMock()
+        await client.subscribe_to_config(callback)
+        client._nc.subscribe.assert_called_once()
+        assert client._config_callback is callback
+
+    def test_is_subscribed_to_config_after_subscription(self, client):
+        assert client.is_subscribed_to_config is False
+        # Only existence matters here; a namespace avoids Mock's child tree.
+        client._config_subscription = SimpleNamespace()
+        assert client.is_subscribed_to_config is True
+
+    async def test_handle_config_message_success(self, client):
+        callback = AsyncMock()
+        client._config_callback = callback
+        mock_msg = Mock()
+        mock_msg.data = GOOD_CFG_BYTES
+        await client._handle_config_message(mock_msg)
+        callback.assert_awaited_once_with(GOOD_CFG)
+
+    async def test_handle_config_message_invalid_config(self, client):
+        callback = AsyncMock()
+        client._config_callback = callback
+        mock_msg = Mock()
+        mock_msg.data = EMPTY_CFG_BYTES
+        await client._handle_config_message(mock_msg)
+        callback.assert_not_awaited()
+
+    async def test_handle_config_message_invalid_json(self, client):
+        callback = AsyncMock()
+        client._config_callback = callback
+        mock_msg = Mock()
+        mock_msg.data = BAD_JSON_BYTES
+        await client._handle_config_message(mock_msg)
+        callback.assert_not_awaited()
+
+    async def test_handle_config_message_no_callback(self, client):
+        mock_msg = Mock()
+        mock_msg.data = SYMBOLS_ONLY_CFG_BYTES
+        # Must not raise even though no callback is registered.
+        await client._handle_config_message(mock_msg)
+
+    async def test_disconnect_with_subscription(self, client):
+        mock_subscription = SimpleNamespace(unsubscribe=AsyncMock())
+        client._config_subscription = mock_subscription
+        await client.disconnect()
+        mock_subscription.unsubscribe.assert_called_once()
+        assert client.is_subscribed_to_config is False
@@ -0,0 +1,184 @@
+"""Tests for the reactive search/matching logic of ReactiveOrderWatcher."""
+
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.models.order import Order
+from src.storage.config_manager import Config, SymbolConfig
+from src.watcher.reactive_order_watcher import ReactiveOrderWatcher
+
+# Frozen clock aligned with the fixed search-request timestamps; the
+# matching window is relative, so nothing here needs the real wall time.
+NOW_UTC = datetime(2025, 1, 15, 20, 10, 11, tzinfo=timezone.utc)
+
+# The canonical matching order; tests derive variants via dataclasses.replace
+# so only the fields under test are respecified.
+BASE_ORDER = Order(
+    id="order_1",
+    symbol="PAMP",
+    side="Bid",
+    price=0.081,
+    size=1000.0,
+    owner="0x0",
+    timestamp=NOW_UTC,
+    status="open",
+)
+
+
+@pytest.fixture(scope="module")
+def temp_dir(tmp_path_factory):
+    # The config only needs a path that exists; pytest cleans it up itself.
+    return str(tmp_path_factory.mktemp("watcher"))
+
+
+# The config is read-only in every test, so one validation pass covers the
+# whole module; the manager mocks live just as long and are reset per test.
+@pytest.fixture(scope="module")
+def mock_config_manager(temp_dir):
+    config = Config(
+        api_host="127.0.0.1",
+        api_port=8000,
+        node_logs_path=temp_dir,
+        data_path=temp_dir,
+        logs_path=temp_dir,
+        log_level="INFO",
+        log_max_size_mb=50,
+        log_retention_days=30,
+        ws_max_connections=100,
+        nats_url="nats://localhost:4222",
+        nats_creds_file="",
+        config_refresh_interval=60,
+        min_liquidity=0.0,
+        symbols_config=[
+            SymbolConfig(symbol="PAMP", min_liquidity=50.0, enabled=True),
+            SymbolConfig(symbol="BTC", min_liquidity=1000.0, enabled=True),
+            SymbolConfig(symbol="ETH", min_liquidity=500.0, enabled=False),
+        ],
+    )
+    manager = Mock()
+    manager.get_config = Mock(return_value=config)
+    return manager
+
+
+@pytest.fixture(scope="module")
+def mock_order_manager():
+    manager = Mock()
+    manager.update_order = AsyncMock()
+    return manager
+
+
+@pytest.fixture(scope="module")
+def mock_websocket_manager():
+    manager = Mock()
+    manager.broadcast = AsyncMock()
+    return manager
+
+
+@pytest.fixture(autouse=True)
+def _reset_manager_mocks(mock_order_manager, mock_websocket_manager):
+    mock_order_manager.reset_mock()
+    mock_websocket_manager.reset_mock()
+
+
+@pytest.fixture
+def reactive_watcher(mock_config_manager, mock_order_manager, mock_websocket_manager):
+    return ReactiveOrderWatcher(
+        mock_config_manager,
+        mock_order_manager,
+        nats_client=AsyncMock(),
+        websocket_manager=mock_websocket_manager,
+    )
+
+
+class TestNewSearchLogic:
+    async def test_add_search_request(self, reactive_watcher):
+        request = {
+            "ticker": "PAMP",
+            "side": "Bid",
+            "timestamp": "2025-01-15T20:10:12Z",
+        }
+        assert await reactive_watcher.add_search_request(request) is True
+        assert len(reactive_watcher.active_requests) == 1
+
+    async def test_invalid_timestamp_format(self, reactive_watcher):
+        request = {
+            "ticker": "PAMP",
+            "side": "Bid",
+            "timestamp": "not-a-timestamp",
+        }
+        assert await reactive_watcher.add_search_request(request) is False
+        assert len(reactive_watcher.active_requests) == 0
+
+    async def test_find_matching_requests(self, reactive_watcher):
+        request = {
+            "ticker": "PAMP",
+            "side": "Bid",
+            "timestamp": NOW_UTC.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+        await reactive_watcher.add_search_request(request)
+        matches = await reactive_watcher._find_matching_requests(BASE_ORDER)
+        assert len(matches) == 1
+        assert matches[0]["ticker"] == "PAMP"
+
+    async def test_find_matching_requests_wrong_ticker(self, reactive_watcher):
+        request = {
+            "ticker": "BTC",
+            "side": "Bid",
+            "timestamp": NOW_UTC.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+        await reactive_watcher.add_search_request(request)
+        assert await reactive_watcher._find_matching_requests(BASE_ORDER) == []
+
+    async def test_find_matching_requests_time_filter(self, reactive_watcher):
+        request = {
+            "ticker": "PAMP",
+            "side": "Bid",
+            "timestamp": NOW_UTC.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+        await reactive_watcher.add_search_request(request)
+        order = replace(BASE_ORDER, timestamp=NOW_UTC - timedelta(seconds=10))
+        assert await reactive_watcher._find_matching_requests(order) == []
+
+    def test_select_best_order_prefers_open(self, reactive_watcher):
+        order1 = replace(BASE_ORDER, status="filled")
+        order2 = replace(BASE_ORDER, id="order_2", size=500.0)
+        best = reactive_watcher._select_best_order([order1, order2], {})
+        assert best.id == "order_2"
+
+    def test_select_best_order_highest_notional(self, reactive_watcher):
+        order2 = replace(BASE_ORDER, id="order_2", size=2000.0)
+        order3 = replace(BASE_ORDER, id="order_3", size=1500.0)
+        best = reactive_watcher._select_best_order([BASE_ORDER, order2, order3], {})
+        assert best.id == "order_2"
+
+    def test_select_best_order_empty(self, reactive_watcher):
+        assert reactive_watcher._select_best_order([], {}) is None
+
+    def test_check_order_configuration(self, reactive_watcher):
+        assert reactive_watcher._check_order_configuration(BASE_ORDER) is True
+
+        too_small = replace(BASE_ORDER, id="order_2", price=0.01, size=100.0)
+        assert reactive_watcher._check_order_configuration(too_small) is False
+
+        disabled = replace(BASE_ORDER, id="order_3", symbol="ETH", price=3000.0, size=10.0)
+        assert reactive_watcher._check_order_configuration(disabled) is False
+
+        unknown = replace(BASE_ORDER, id="order_4", symbol="DOGE", price=0.1)
+        assert reactive_watcher._check_order_configuration(unknown) is False
+
+    def test_add_order_to_cache(self, reactive_watcher):
+        reactive_watcher._add_order_to_cache(BASE_ORDER)
+        assert reactive_watcher.orders_cache["PAMP"][-1].id == "order_1"
+
+    async def test_process_order_publishes_match(self, reactive_watcher):
+        request = {
+            "ticker": "PAMP",
+            "side": "Bid",
+            "timestamp": NOW_UTC.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+        await reactive_watcher.add_search_request(request)
+        await reactive_watcher.process_order(BASE_ORDER)
+        reactive_watcher.nats_client.publish_order_data.assert_awaited_once()
@@ -0,0 +1,91 @@
+"""Unit tests for NodeHealthMonitor."""
+
+import os
+import time
+
+from src.monitoring.node_health import NodeHealthMonitor
+
+
+class TestNodeHealthMonitor:
+    def test_init(self, tmp_path):
+        monitor = NodeHealthMonitor(str(tmp_path), threshold_minutes=5)
+        assert monitor.logs_path == tmp_path
+        assert monitor.threshold_minutes == 5
+
+    def test_get_last_log_update_time_no_directory(self, tmp_path):
+        monitor = NodeHealthMonitor(str(tmp_path / "missing"))
+        assert monitor.get_last_log_update_time() is None
+
+    def test_get_last_log_update_time_empty_directory(self, tmp_path):
+        monitor = NodeHealthMonitor(str(tmp_path))
+        assert monitor.get_last_log_update_time() is None
+
+    def test_get_last_log_update_time_with_files(self, tmp_path):
+        log_file = tmp_path / "node.log"
+        log_file.touch()
+        known_ts = time.time() - 180
+        os.utime(log_file, (known_ts, known_ts))
+
+        monitor = NodeHealthMonitor(str(tmp_path))
+        last_update = monitor.get_last_log_update_time()
+        assert last_update is not None
+        assert abs(last_update.timestamp() - known_ts) < 2
+
+    def test_get_health_status_healthy(self, tmp_path):
+        log_file = tmp_path / "node.log"
+        log_file.touch()
+        recent_ts = time.time() - 120
+        os.utime(log_file, (recent_ts, recent_ts))
+
+        monitor = NodeHealthMonitor(str(tmp_path), threshold_minutes=5)
+        status = monitor.get_health_status()
+        assert status["healthy"] is True
+        assert status["threshold_minutes"] == 5
+
+    def test_get_health_status_unhealthy(self, tmp_path):
+        log_file = tmp_path / "node.log"
+        log_file.touch()
+        stale_ts = time.time() - 600
+        os.utime(log_file, (stale_ts, stale_ts))
+
+        monitor = NodeHealthMonitor(str(tmp_path), threshold_minutes=5)
+        status = monitor.get_health_status()
+        assert status["healthy"] is False
+
+    def test_get_health_status_exact_threshold(self, tmp_path):
+        log_file = tmp_path / "node.log"
+        log_file.touch()
+        edge_ts = time.time() - 300
+        os.utime(log_file, (edge_ts, edge_ts))
+
+        monitor = NodeHealthMonitor(str(tmp_path), threshold_minutes=5)
+        status = monitor.get_health_status()
+        # The age keeps growing after utime, so at the boundary it tips over.
+        assert status["healthy"] is False
+
+    def test_get_health_status_no_files(self, tmp_path):
+        monitor = NodeHealthMonitor(str(tmp_path), threshold_minutes=5)
+        status = monitor.get_health_status()
+        assert status["healthy"] is False
+        assert status["last_update"] is None
+
+    def test_get_health_status_subdirectories(self, tmp_path):
+        nested = tmp_path / "hourly" / "9"
+        nested.mkdir(parents=True)
+        log_file = nested / "node.log"
+        log_file.touch()
+        recent_ts = time.time() - 60
+        os.utime(log_file, (recent_ts, recent_ts))
+
+        monitor = NodeHealthMonitor(str(tmp_path), threshold_minutes=5)
+        status = monitor.get_health_status()
+        assert status["healthy"] is True
+
+    def test_custom_threshold(self, tmp_path):
+        log_file = tmp_path / "node.log"
+        log_file.touch()
+        stale_ts = time.time() - 600
+        os.utime(log_file, (stale_ts, stale_ts))
+
+        monitor = NodeHealthMonitor(str(tmp_path), threshold_minutes=30)
+        assert monitor.get_health_status()["healthy"] is True
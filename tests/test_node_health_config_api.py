@@ -0,0 +1,118 @@
+"""API tests for the node health configuration endpoints."""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.app import app
+from src.storage.config_manager import Config, NodeHealthConfig, SymbolConfig
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient for the whole session.
+
+    Entering the client as a context manager runs the app's lifespan
+    handlers exactly once instead of per request batch.
+    """
+    with TestClient(app) as c:
+        yield c
+
+
+class TestNodeHealthConfigAPI:
+    # Built once per class: every pydantic field revalidates on construction
+    # and no test mutates the instance (updates go through model_copy).
+    @classmethod
+    def setup_class(cls):
+        cls.mock_config = Config(
+            api_host="127.0.0.1",
+            api_port=8000,
+            node_logs_path="/var/hl/node_logs",
+            data_path="data",
+            logs_path="logs",
+            log_level="INFO",
+            log_max_size_mb=50,
+            log_retention_days=30,
+            ws_max_connections=100,
+            nats_url="nats://localhost:4222",
+            nats_creds_file="",
+            config_refresh_interval=60,
+            min_liquidity=0.0,
+            symbols_config=[SymbolConfig(symbol="BTC", min_liquidity=1000.0)],
+            node_health=NodeHealthConfig(
+                enabled=True, threshold_minutes=5, check_interval_seconds=60
+            ),
+        )
+
+    def test_get_node_health_config(self, client):
+        with patch("src.api.app.config_manager") as mock_manager:
+            mock_manager.get_config = Mock(return_value=self.mock_config)
+            response = client.get("/api/v1/config/node-health")
+        assert response.status_code == 200
+        assert response.json() == {
+            "enabled": True,
+            "threshold_minutes": 5,
+            "check_interval_seconds": 60,
+        }
+
+    def test_get_node_health_config_not_loaded(self, client):
+        with patch("src.api.app.config_manager") as mock_manager:
+            mock_manager.get_config = Mock(side_effect=RuntimeError("not loaded"))
+            response = client.get("/api/v1/config/node-health")
+        assert response.status_code == 503
+
+    def test_update_node_health_config(self, client):
+        updated = self.mock_config.model_copy(
+            update={"node_health": NodeHealthConfig(threshold_minutes=10)}
+        )
+        with patch("src.api.app.config_manager") as mock_manager:
+            mock_manager.update_config_async = AsyncMock(return_value=updated)
+            response = client.put(
+                "/api/v1/config/node-health",
+                json={"enabled": True, "threshold_minutes": 10, "check_interval_seconds": 60},
+            )
+        assert response.status_code == 200
+        assert response.json()["threshold_minutes"] == 10
+
+    def test_update_node_health_config_invalid_threshold(self, client):
+        response = client.put(
+            "/api/v1/config/node-health",
+            json={"enabled": True, "threshold_minutes": 0, "check_interval_seconds": 60},
+        )
+        assert response.status_code == 422
+
+    def test_node_health_endpoint_healthy(self, client):
+        with patch("src.api.app.config_manager") as mock_manager, patch(
+            "src.api.app.NodeHealthMonitor"
+        ) as mock_monitor_cls:
+            mock_manager.get_config = Mock(return_value=self.mock_config)
+            mock_monitor_cls.return_value.get_health_status.return_value = {
+                "healthy": True,
+                "last_update": "2025-01-01T00:00:00+00:00",
+                "age_minutes": 1.0,
+                "threshold_minutes": 5,
+            }
+            response = client.get("/api/v1/node/health")
+        assert response.status_code == 200
+        assert response.json()["healthy"] is True
+
+    def test_node_health_endpoint_unhealthy(self, client):
+        with patch("src.api.app.config_manager") as mock_manager, patch(
+            "src.api.app.NodeHealthMonitor"
+        ) as mock_monitor_cls:
+            mock_manager.get_config = Mock(return_value=self.mock_config)
+            mock_monitor_cls.return_value.get_health_status.return_value = {
+                "healthy": False,
+                "last_update": None,
+                "age_minutes": None,
+                "threshold_minutes": 5,
+            }
+            response = client.get("/api/v1/node/health")
+        assert response.status_code == 200
+        assert response.json()["healthy"] is False
+
+    def test_get_orders_not_ready(self, client):
+        with patch("src.api.app.order_manager", None):
+            response = client.get("/api/v1/orders")
+        assert response.status_code == 503
@@ -0,0 +1,77 @@
+"""Unit tests for OrderExtractor."""
+
+import pytest
+
+from src.parser.order_extractor import REJECTED_STATUSES, OrderExtractor
+
+
+@pytest.fixture
+def base_log_entry():
+    """Valid log entry template; tests shallow-merge only their deltas."""
+    return {
+        "time": "2025-09-02T08:26:36.877863946",
+        "user": "0x123",
+        "status": "open",
+        "order": {
+            "coin": "BTC",
+            "side": "B",
+            "limitPx": "50000",
+            "origSz": "1.0",
+            "oid": 123,
+        },
+    }
+
+
+class TestOrderExtractor:
+    # extract_order is read-only, so one extractor serves the whole class.
+    @classmethod
+    def setup_class(cls):
+        cls.extractor = OrderExtractor()
+
+    def test_extract_order_success(self, base_log_entry):
+        owner = "0x1234567890abcdef1234567890abcdef12345678"
+        order = self.extractor.extract_order({**base_log_entry, "user": owner})
+        assert order is not None
+        assert order.id == "123"
+        assert order.symbol == "BTC"
+        assert order.side == "Bid"
+        assert order.price == 50000.0
+        assert order.size == 1.0
+        assert order.owner == owner
+        assert order.status == "open"
+
+    def test_extract_order_ask_side(self, base_log_entry):
+        entry = {
+            **base_log_entry,
+            "order": {**base_log_entry["order"], "coin": "ETH", "side": "A"},
+        }
+        order = self.extractor.extract_order(entry)
+        assert order is not None
+        assert order.side == "Ask"
+
+    def test_extract_order_invalid_side_returns_none(self, base_log_entry):
+        entry = {**base_log_entry, "order": {**base_log_entry["order"], "side": "X"}}
+        assert self.extractor.extract_order(entry) is None
+
+    def test_extract_order_zero_price_returns_none(self, base_log_entry):
+        entry = {**base_log_entry, "order": {**base_log_entry["order"], "limitPx": "0"}}
+        assert self.extractor.extract_order(entry) is None
+
+    def test_extract_order_zero_size_returns_none(self, base_log_entry):
+        entry = {**base_log_entry, "order": {**base_log_entry["order"], "origSz": "0"}}
+        assert self.extractor.extract_order(entry) is None
+
+    def test_extract_order_missing_order_field_returns_none(self, base_log_entry):
+        entry = dict(base_log_entry)
+        del entry["order"]
+        assert self.extractor.extract_order(entry) is None
+
+    def test_extract_order_invalid_time_returns_none(self, base_log_entry):
+        entry = {**base_log_entry, "time": "not a timestamp"}
+        assert self.extractor.extract_order(entry) is None
+
+    # One case per status: each reports its own pass/fail and distributes
+    # under pytest-xdist instead of running as a single serial loop.
+    @pytest.mark.parametrize("status", sorted(REJECTED_STATUSES))
+    def test_extract_order_rejected_statuses_return_none(self, base_log_entry, status):
+        assert self.extractor.extract_order({**base_log_entry, "status": status}) is None